@@ -10,6 +10,7 @@ from core.state_manager import StateManager, LOADING_SCREEN, MAIN_MENU, HIGH_SCO
 from core.opengl_manager import OpenGLManager
 from core.input_handler import InputHandler
 from core.settings import GameSettings
+from ui.font_atlas import font_atlas
 from screens.loading_screen import LoadingScreen
 from screens.main_menu_screen import MainMenuScreen
 from screens.highscore_screen import HighScoreScreen
@@ -80,6 +81,10 @@ class GameEngine:
     
     def display(self):
         """Main display function"""
+        # Bake the text atlas on the first frame (again after a reshape if fonts did
+        # not fit), the clear below wipes any scratch glyphs left in the back buffer
+        font_atlas.bake()
+        
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
         # Update and render current state
@@ -91,6 +96,9 @@ class GameEngine:
     def reshape(self, width, height):
         """Handle window reshape"""
         glViewport(0, 0, width, height)
+        self.opengl_manager.set_window_size(width, height)
+        self.state_manager.set_window_width(width)
+        font_atlas.retry_unbaked()
     
     def timer(self, value):
         """Timer function for animation"""
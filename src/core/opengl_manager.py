@@ -12,6 +12,7 @@ class OpenGLManager:
     
     def __init__(self):
         self.background_texture = None
+        self.window_size = None  # (width, height), kept current by reshape
     
     def initialize(self):
         """Initialize OpenGL settings"""
@@ -69,20 +70,33 @@ class OpenGLManager:
             print(f"Failed to load background texture: {e}")
             self.background_texture = None
     
+    def set_window_size(self, width, height):
+        """Remember the window size reported by the reshape callback"""
+        self.window_size = (width, height)
+    
+    def get_window_size(self):
+        """Get the cached window size, querying GLUT only before the first reshape"""
+        if self.window_size is None:
+            self.window_size = (glutGet(GLUT_WINDOW_WIDTH), glutGet(GLUT_WINDOW_HEIGHT))
+        return self.window_size
+    
     def setup_2d_projection(self):
         """Setup 2D projection for UI rendering"""
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
-        glOrtho(0, glutGet(GLUT_WINDOW_WIDTH), glutGet(GLUT_WINDOW_HEIGHT), 0, -1, 1)
+        width, height = self.get_window_size()
+        glOrtho(0, width, height, 0, -1, 1)
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
         glDisable(GL_DEPTH_TEST)
+        glDisable(GL_LIGHTING)
     
     def setup_3d_projection(self):
         """Setup 3D projection for game rendering"""
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
-        gluPerspective(45, glutGet(GLUT_WINDOW_WIDTH)/glutGet(GLUT_WINDOW_HEIGHT), 0.1, 1000.0)
+        width, height = self.get_window_size()
+        gluPerspective(45, width/height, 0.1, 1000.0)
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
         glEnable(GL_DEPTH_TEST)
@@ -90,3 +104,44 @@ class OpenGLManager:
     def get_background_texture(self):
         """Get the background texture ID"""
         return self.background_texture
+    
+    def capture_frame_texture(self, texture=None):
+        """Copy the current back buffer into a texture and return its ID"""
+        width, height = self.get_window_size()
+        
+        if texture is None:
+            texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        
+        # Copy straight from the framebuffer, no round trip through Python
+        glReadBuffer(GL_BACK)
+        glCopyTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, 0, 0, width, height, 0)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        return texture
+    
+    def draw_fullscreen_texture(self, texture):
+        """Draw a texture over the whole window (expects the 2D projection)"""
+        width, height = self.get_window_size()
+        
+        glPushAttrib(GL_ENABLE_BIT)
+        glDisable(GL_LIGHTING)
+        glDisable(GL_DEPTH_TEST)
+        glDisable(GL_BLEND)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glColor3f(1.0, 1.0, 1.0)
+        
+        # Framebuffer rows start at the bottom, the 2D projection at the top
+        glBegin(GL_QUADS)
+        glTexCoord2f(0.0, 1.0); glVertex2f(0, 0)
+        glTexCoord2f(1.0, 1.0); glVertex2f(width, 0)
+        glTexCoord2f(1.0, 0.0); glVertex2f(width, height)
+        glTexCoord2f(0.0, 0.0); glVertex2f(0, height)
+        glEnd()
+        
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glPopAttrib()
@@ -25,6 +25,7 @@ class StateManager:
         self.transition_direction = 0  # 1 for forward, -1 for backward
         self.menu_transition_time = 0
         self.menu_animation_offset = 0
+        self.window_width = None  # Kept current by the reshape callback
         
         # Initialize screens (will be set by game engine)
         self.screens = {}
@@ -37,6 +38,10 @@ class StateManager:
         """Set the loading start time"""
         self.loading_start_time = start_time
     
+    def set_window_width(self, width):
+        """Remember the window width reported by the reshape callback"""
+        self.window_width = width
+    
     def get_current_state(self):
         """Get the current game state"""
         return self.current_state
@@ -74,7 +79,9 @@ class StateManager:
             else:
                 # Smooth easing function
                 ease_progress = 1 - (1 - transition_progress) ** 3
-                self.menu_animation_offset = self.transition_direction * (1 - ease_progress) * glutGet(GLUT_WINDOW_WIDTH)
+                if self.window_width is None:
+                    self.window_width = glutGet(GLUT_WINDOW_WIDTH)
+                self.menu_animation_offset = self.transition_direction * (1 - ease_progress) * self.window_width
         
         # Handle loading screen auto-transition
         if self.current_state == LOADING_SCREEN:
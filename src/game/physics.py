@@ -115,20 +115,22 @@ class Ball:
     
     def check_platform_collision(self, platform):
         """Check collision with a platform"""
-        # Simple box collision detection
-        px, py, pz = platform.x, platform.y, platform.z
-        pw, ph, pd = platform.width, platform.height, platform.depth
+        # Simple box collision detection, extents precomputed by the platform
+        px, pz = platform.x, platform.z
         
         # Check if ball is within platform bounds (with some tolerance)
         tolerance = 0.1
-        if (px - pw/2 - tolerance <= self.x <= px + pw/2 + tolerance and
-            pz - pd/2 - tolerance <= self.z <= pz + pd/2 + tolerance):
+        reach_x = platform.half_width + tolerance
+        reach_z = platform.half_depth + tolerance
+        if (px - reach_x <= self.x <= px + reach_x and
+            pz - reach_z <= self.z <= pz + reach_z):
             
             # Check if ball is on top of platform
-            if (self.y - self.radius <= py + ph/2 and 
-                self.y - self.radius >= py + ph/2 - 1.0):
+            top = platform.top
+            bottom = self.y - self.radius
+            if top - 1.0 <= bottom <= top:
                 
-                self.y = py + ph/2 + self.radius
+                self.y = top + self.radius
                 if self.vy < 0:
                     self.vy = 0
                 return True
@@ -22,6 +22,11 @@ class Platform:
         self.platform_type = platform_type  # normal, speed_boost, bounce, slippery, moving
         self.passed = False  # For scoring
         
+        # Collision extents, fixed since only x ever moves
+        self.half_width = width / 2
+        self.half_depth = depth / 2
+        self.top = y + height / 2
+        
         # Moving platform properties
         self.moving = platform_type == 'moving'
         self.move_speed = 2.0
@@ -145,6 +150,10 @@ class LevelGenerator:
         self.platform_spacing = 4.0
         self.difficulty_increase_rate = 0.1
         
+        # Platforms (and obstacles) are kept in order of decreasing z, levels
+        # never overlap, so the passed ones are always a prefix of the list
+        self._next_unpassed = 0
+        
     def generate_starting_platform(self):
         """Generate the starting platform"""
         platform = Platform(0, 0, 0, width=4.0, height=0.4, depth=4.0, color=(0.2, 0.8, 0.2))
@@ -177,6 +186,7 @@ class LevelGenerator:
             # Hard: Small platforms, large gaps, moving platforms
             level_platforms = self._generate_hard_level()
         
+        level_platforms.sort(key=lambda platform: platform.z, reverse=True)
         self.platforms.extend(level_platforms)
         
         # Add obstacles based on difficulty
@@ -312,23 +322,31 @@ class LevelGenerator:
     def check_platform_passed(self, ball_z, score):
         """Check if ball has passed platforms and update score"""
         new_score = score
-        for platform in self.platforms:
-            if not platform.passed and ball_z < platform.z - 1.0:
-                platform.passed = True
-                new_score += 1
+        platforms = self.platforms
+        index = self._next_unpassed
+        while index < len(platforms) and ball_z < platforms[index].z - 1.0:
+            platforms[index].passed = True
+            new_score += 1
+            index += 1
+        self._next_unpassed = index
         return new_score
     
     def cleanup_distant_platforms(self, ball_z):
         """Remove platforms that are too far behind the ball"""
-        self.platforms = [p for p in self.platforms if p.z > ball_z + 20.0]
-        self.obstacles = [o for o in self.obstacles if o.z > ball_z + 20.0]
+        # The kept ones are a prefix of the z ordered lists, drop from the end
+        threshold = ball_z + 20.0
+        while self.platforms and not self.platforms[-1].z > threshold:
+            self.platforms.pop()
+        while self.obstacles and not self.obstacles[-1].z > threshold:
+            self.obstacles.pop()
+        self._next_unpassed = min(self._next_unpassed, len(self.platforms))
     
     def should_generate_more(self, ball_z):
         """Check if we need to generate more platforms ahead"""
         if not self.platforms:
             return True
         
-        furthest_z = min(p.z for p in self.platforms)
+        furthest_z = self.platforms[-1].z
         return ball_z < furthest_z + 15.0
     
     def update_platforms(self, dt):
@@ -3,9 +3,35 @@
 """
 
 import math
+from contextlib import contextmanager
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+@contextmanager
+def ortho2d(window_width, window_height):
+    """Draw in 2D window coordinates for the duration of the block"""
+    # Switch to 2D mode
+    glMatrixMode(GL_PROJECTION)
+    glPushMatrix()
+    glLoadIdentity()
+    glOrtho(0, window_width, window_height, 0, -1, 1)
+    glMatrixMode(GL_MODELVIEW)
+    glPushMatrix()
+    glLoadIdentity()
+    
+    glDisable(GL_LIGHTING)
+    glDisable(GL_DEPTH_TEST)
+    try:
+        yield
+    finally:
+        # Restore 3D mode
+        glEnable(GL_DEPTH_TEST)
+        glEnable(GL_LIGHTING)
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+
 class Renderer3D:
     """3D rendering utilities"""
     
@@ -103,162 +129,117 @@ class Renderer3D:
         """Draw score card in corner"""
         from ui.renderer import UIRenderer
         
-        # Switch to 2D mode
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, window_width, window_height, 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        # Card background
-        card_width = 150
-        card_height = 80
-        card_x = window_width - card_width - 20
-        card_y = 20
-        
-        # Draw card background with rounded corners effect
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        
-        # Shadow
-        glColor4f(0.0, 0.0, 0.0, 0.3)
-        glBegin(GL_QUADS)
-        glVertex2f(card_x + 3, card_y + 3)
-        glVertex2f(card_x + card_width + 3, card_y + 3)
-        glVertex2f(card_x + card_width + 3, card_y + card_height + 3)
-        glVertex2f(card_x + 3, card_y + card_height + 3)
-        glEnd()
-        
-        # Main card
-        glColor4f(0.1, 0.1, 0.2, 0.9)
-        glBegin(GL_QUADS)
-        glVertex2f(card_x, card_y)
-        glVertex2f(card_x + card_width, card_y)
-        glVertex2f(card_x + card_width, card_y + card_height)
-        glVertex2f(card_x, card_y + card_height)
-        glEnd()
-        
-        # Card border
-        glColor4f(0.4, 0.6, 1.0, 0.8)
-        glLineWidth(2.0)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(card_x, card_y)
-        glVertex2f(card_x + card_width, card_y)
-        glVertex2f(card_x + card_width, card_y + card_height)
-        glVertex2f(card_x, card_y + card_height)
-        glEnd()
-        glLineWidth(1.0)
-        
-        glDisable(GL_BLEND)
-        
-        # Score text
-        glColor3f(1.0, 1.0, 1.0)
-        score_title = "SCORE"
-        try:
-            from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_12
-            title_width = UIRenderer.get_text_width(score_title, GLUT_BITMAP_HELVETICA_12)
-            title_x = card_x + (card_width - title_width) // 2
-            UIRenderer.draw_text(score_title, title_x, card_y + 25, GLUT_BITMAP_HELVETICA_12)
-        except ImportError:
-            # Fallback text rendering
-            title_x = card_x + 50
-            glRasterPos2f(title_x, card_y + 25)
-            for char in score_title:
-                pass  # Skip text if fonts not available
-        
-        # Score value
-        score_text = str(score)
-        try:
-            from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_12
-            score_width = UIRenderer.get_text_width(score_text, GLUT_BITMAP_HELVETICA_12) * 1.5
-            score_x = card_x + (card_width - score_width) // 2
+        with ortho2d(window_width, window_height):
+            # Card background
+            card_width = 150
+            card_height = 80
+            card_x = window_width - card_width - 20
+            card_y = 20
             
-            # Make score number larger and more prominent
-            glColor3f(1.0, 0.8, 0.2)
-            glRasterPos2f(score_x, card_y + 55)
-            for char in score_text:
-                from OpenGL.GLUT import glutBitmapCharacter, GLUT_BITMAP_TIMES_ROMAN_24
-                glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
-        except ImportError:
-            # Fallback if GLUT fonts not available
-            glColor3f(1.0, 0.8, 0.2)
-            glRasterPos2f(card_x + 70, card_y + 55)
-            # Skip rendering if fonts not available
-        
-        # Restore 3D mode
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+            # Draw card background with rounded corners effect
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            
+            # Shadow
+            glColor4f(0.0, 0.0, 0.0, 0.3)
+            glBegin(GL_QUADS)
+            glVertex2f(card_x + 3, card_y + 3)
+            glVertex2f(card_x + card_width + 3, card_y + 3)
+            glVertex2f(card_x + card_width + 3, card_y + card_height + 3)
+            glVertex2f(card_x + 3, card_y + card_height + 3)
+            glEnd()
+            
+            # Main card
+            glColor4f(0.1, 0.1, 0.2, 0.9)
+            glBegin(GL_QUADS)
+            glVertex2f(card_x, card_y)
+            glVertex2f(card_x + card_width, card_y)
+            glVertex2f(card_x + card_width, card_y + card_height)
+            glVertex2f(card_x, card_y + card_height)
+            glEnd()
+            
+            # Card border
+            glColor4f(0.4, 0.6, 1.0, 0.8)
+            glLineWidth(2.0)
+            glBegin(GL_LINE_LOOP)
+            glVertex2f(card_x, card_y)
+            glVertex2f(card_x + card_width, card_y)
+            glVertex2f(card_x + card_width, card_y + card_height)
+            glVertex2f(card_x, card_y + card_height)
+            glEnd()
+            glLineWidth(1.0)
+            
+            glDisable(GL_BLEND)
+            
+            # Score text
+            glColor3f(1.0, 1.0, 1.0)
+            score_title = "SCORE"
+            try:
+                from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_12
+                title_width = UIRenderer.get_text_width(score_title, GLUT_BITMAP_HELVETICA_12)
+                title_x = card_x + (card_width - title_width) // 2
+                UIRenderer.draw_text(score_title, title_x, card_y + 25, GLUT_BITMAP_HELVETICA_12)
+            except ImportError:
+                # Fallback text rendering
+                title_x = card_x + 50
+                glRasterPos2f(title_x, card_y + 25)
+                for char in score_title:
+                    pass  # Skip text if fonts not available
+            
+            # Score value
+            score_text = str(score)
+            try:
+                from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_12
+                score_width = UIRenderer.get_text_width(score_text, GLUT_BITMAP_HELVETICA_12) * 1.5
+                score_x = card_x + (card_width - score_width) // 2
+                
+                # Make score number larger and more prominent
+                from OpenGL.GLUT import GLUT_BITMAP_TIMES_ROMAN_24
+                glColor3f(1.0, 0.8, 0.2)
+                UIRenderer.draw_text(score_text, score_x, card_y + 55, GLUT_BITMAP_TIMES_ROMAN_24)
+            except ImportError:
+                # Fallback if GLUT fonts not available
+                glColor3f(1.0, 0.8, 0.2)
+                glRasterPos2f(card_x + 70, card_y + 55)
+                # Skip rendering if fonts not available
     
     @staticmethod
     def draw_game_over_screen(score, window_width, window_height):
         """Draw game over screen"""
         from ui.renderer import UIRenderer
         
-        # Switch to 2D mode
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, window_width, window_height, 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        # Semi-transparent overlay
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glColor4f(0.0, 0.0, 0.0, 0.7)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(window_width, 0)
-        glVertex2f(window_width, window_height)
-        glVertex2f(0, window_height)
-        glEnd()
-        glDisable(GL_BLEND)
-        
-        # Game Over text
-        center_y = window_height // 2
-        
-        try:
-            from OpenGL.GLUT import GLUT_BITMAP_TIMES_ROMAN_24, GLUT_BITMAP_HELVETICA_18, GLUT_BITMAP_HELVETICA_12
-            glColor3f(1.0, 0.2, 0.2)
-            game_over_text = "GAME OVER"
-            UIRenderer.draw_centered_text(game_over_text, center_y - 60, GLUT_BITMAP_TIMES_ROMAN_24, (1.0, 0.2, 0.2))
+        with ortho2d(window_width, window_height):
+            # Semi-transparent overlay
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            glColor4f(0.0, 0.0, 0.0, 0.7)
+            UIRenderer.draw_fullscreen_quad(window_width, window_height)
+            glDisable(GL_BLEND)
             
-            # Final score
-            glColor3f(1.0, 1.0, 0.2)
-            final_score_text = f"Final Score: {score}"
-            UIRenderer.draw_centered_text(final_score_text, center_y - 20, GLUT_BITMAP_HELVETICA_18, (1.0, 1.0, 0.2))
+            # Game Over text
+            center_y = window_height // 2
             
-            # Instructions
-            glColor3f(0.8, 0.8, 0.8)
-            restart_text = "Press R to Restart or ESC to Return to Menu"
-            UIRenderer.draw_centered_text(restart_text, center_y + 20, GLUT_BITMAP_HELVETICA_12, (0.8, 0.8, 0.8))
-        except ImportError:
-            # Fallback if fonts not available - just show basic colored rectangles
-            glColor3f(1.0, 0.2, 0.2)
-            glBegin(GL_QUADS)
-            glVertex2f(window_width//2 - 100, center_y - 70)
-            glVertex2f(window_width//2 + 100, center_y - 70)
-            glVertex2f(window_width//2 + 100, center_y - 50)
-            glVertex2f(window_width//2 - 100, center_y - 50)
-            glEnd()
-        
-        # Restore 3D mode
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+            try:
+                from OpenGL.GLUT import GLUT_BITMAP_TIMES_ROMAN_24, GLUT_BITMAP_HELVETICA_18, GLUT_BITMAP_HELVETICA_12
+                glColor3f(1.0, 0.2, 0.2)
+                game_over_text = "GAME OVER"
+                UIRenderer.draw_centered_text(game_over_text, center_y - 60, GLUT_BITMAP_TIMES_ROMAN_24, (1.0, 0.2, 0.2), window_width)
+                
+                # Final score
+                glColor3f(1.0, 1.0, 0.2)
+                final_score_text = f"Final Score: {score}"
+                UIRenderer.draw_centered_text(final_score_text, center_y - 20, GLUT_BITMAP_HELVETICA_18, (1.0, 1.0, 0.2), window_width)
+                
+                # Instructions
+                glColor3f(0.8, 0.8, 0.8)
+                restart_text = "Press R to Restart or ESC to Return to Menu"
+                UIRenderer.draw_centered_text(restart_text, center_y + 20, GLUT_BITMAP_HELVETICA_12, (0.8, 0.8, 0.8), window_width)
+            except ImportError:
+                # Fallback if fonts not available - just show basic colored rectangles
+                glColor3f(1.0, 0.2, 0.2)
+                glBegin(GL_QUADS)
+                glVertex2f(window_width//2 - 100, center_y - 70)
+                glVertex2f(window_width//2 + 100, center_y - 70)
+                glVertex2f(window_width//2 + 100, center_y - 50)
+                glVertex2f(window_width//2 - 100, center_y - 50)
+                glEnd()
@@ -5,11 +5,13 @@ Just a ball on an infinite platform that can be controlled with WASD and spaceba
 
 import time
 import math
+from bisect import bisect_left, bisect_right
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 from screens.base_screen import BaseScreen
 from core.settings import game_settings
+from ui.renderer import UIRenderer
 
 # Ensure font constants are available
 try:
@@ -20,6 +22,60 @@ except ImportError:
     # Fallback if specific constants are not available
     pass
 
+# Scene ambient light (light 0 plus the light model default), kept as
+# GLfloat arrays so the per-frame light calls skip the list conversion
+LIGHT_AMBIENT = (GLfloat * 4)(0.3, 0.3, 0.3, 1.0)
+MODEL_AMBIENT = (GLfloat * 4)(0.2, 0.2, 0.2, 1.0)
+
+# Platform ambient material is 0.3 * color, folded into the light while the
+# color material drives ambient and diffuse from the platform color
+PLATFORM_AMBIENT_SCALE = 0.3
+PLATFORM_LIGHT_AMBIENT = (GLfloat * 4)(*[c * PLATFORM_AMBIENT_SCALE for c in LIGHT_AMBIENT[:3]], 1.0)
+PLATFORM_MODEL_AMBIENT = (GLfloat * 4)(*[c * PLATFORM_AMBIENT_SCALE for c in MODEL_AMBIENT[:3]], 1.0)
+PLATFORM_SPECULAR = (GLfloat * 4)(0.5, 0.5, 0.5, 1.0)
+
+# Ball materials (ambient, diffuse, specular, shininess)
+BALL_MATERIAL = ((0.2, 0.2, 0.8, 1.0), (0.4, 0.4, 1.0, 1.0), (0.8, 0.8, 1.0, 1.0), 50.0)
+BALL2_MATERIAL = ((0.8, 0.2, 0.2, 1.0), (1.0, 0.4, 0.4, 1.0), (1.0, 0.8, 0.8, 1.0), 50.0)
+
+# Ball tessellation, the ball stays ~80 px tall at the fixed camera distance
+# so 16 slices keep the silhouette within a pixel of a true circle
+BALL_SLICES = 16
+BALL_STACKS = 16
+
+# Player 2 arrow keys and the keys_pressed_p2 entries they drive
+P2_ARROW_KEYS = {GLUT_KEY_UP: 'up', GLUT_KEY_DOWN: 'down',
+                 GLUT_KEY_LEFT: 'left', GLUT_KEY_RIGHT: 'right'}
+
+
+def _integrate_ball(x, y, z, vel_x, vel_y, vel_z, on_ground, dt,
+                    gravity, ground_friction, air_friction, rolling_resistance):
+    """Advance one ball by dt, returns the new (x, y, z, vel_x, vel_y, vel_z)"""
+    # Apply gravity
+    vel_y += gravity * dt
+    
+    # Apply friction and rolling resistance
+    if on_ground:
+        # Ground friction
+        vel_x *= ground_friction
+        vel_z *= ground_friction
+        
+        # Rolling resistance (simulates ball rolling on surface)
+        speed_sq = vel_x * vel_x + vel_z * vel_z
+        if speed_sq > 0:
+            speed = math.sqrt(speed_sq)
+            resistance_force = rolling_resistance * dt
+            resistance_scale = max(0, 1 - resistance_force / speed)
+            vel_x *= resistance_scale
+            vel_z *= resistance_scale
+    else:
+        # Air friction
+        vel_x *= air_friction
+        vel_z *= air_friction
+    
+    # Update position
+    return x + vel_x * dt, y + vel_y * dt, z + vel_z * dt, vel_x, vel_y, vel_z
+
 class Game3DScreen(BaseScreen):
     """Simple 3D game with ball on infinite platform"""
     
@@ -49,6 +105,14 @@ class Game3DScreen(BaseScreen):
         
         # Platform properties - Fall Guys style platforms
         self.platforms = self._create_platforms()
+        self._build_platform_bounds()
+        
+        # Index of the platform each ball rests on (-1 = airborne), once per frame
+        self._contact_platform_idx = -1
+        self._contact_platform_idx_p2 = -1
+        # Platforms under each ball after contact resolution, reused for scoring
+        self._contact_platforms = []
+        self._contact_platforms_p2 = []
         
         # Game state
         self.game_over = False
@@ -63,15 +127,18 @@ class Game3DScreen(BaseScreen):
         
         # Score and timer system
         self.score = 0
-        self.platforms_reached = set()  # Track which platforms have been reached
-        self.start_time = time.time()
+        self.platforms_reached_mask = 0  # Bit i set once platform i has been reached
+        self.platforms_reached_count = 0
+        self._all_platforms_mask = (1 << len(self.platforms)) - 1
+        self.start_time = time.perf_counter()
         self.game_time = 0.0
         self.best_time = float('inf')  # Best completion time
         self.high_score = 0  # Highest score achieved
         
         # Player 2 scoring
         self.score_p2 = 0
-        self.platforms_reached_p2 = set()
+        self.platforms_reached_mask_p2 = 0
+        self.platforms_reached_count_p2 = 0
         self.best_time_p2 = float('inf')
         self.high_score_p2 = 0
         
@@ -84,6 +151,7 @@ class Game3DScreen(BaseScreen):
         
         # Simple physics properties
         self.max_speed = 10.0  # Reduced from 15.0
+        self._max_speed_sq = self.max_speed * self.max_speed
         self.acceleration = 18.0  # Reduced from 25.0
         self.bounce_damping = 0.6  # How much energy is lost on bounce
         self.rolling_resistance = 0.02  # Slight resistance when rolling
@@ -91,6 +159,21 @@ class Game3DScreen(BaseScreen):
         # Camera
         self.camera_distance = 10.0
         self.camera_height = 5.0
+        self.camera_fov = 45.0
+        self.camera_far = 1000.0
+        self._view_aspect = 4.0 / 3.0
+        self._view_eye = (0.0, self.camera_height, self.camera_distance)
+        
+        # The camera looks at the ball from a fixed offset (no yaw or roll), so
+        # its orientation is constant and only the view translation changes
+        length = math.hypot(self.camera_height, self.camera_distance)
+        self._view_up = (self.camera_distance / length, -self.camera_height / length)
+        self._view_back = (self.camera_height / length, self.camera_distance / length)
+        self._view_matrix = (GLfloat * 16)(
+            1.0, 0.0, 0.0, 0.0,
+            0.0, self._view_up[0], self._view_back[0], 0.0,
+            0.0, self._view_up[1], self._view_back[1], 0.0,
+            0.0, 0.0, 0.0, 1.0)
         
         # Input state
         self.keys_pressed = {
@@ -103,10 +186,40 @@ class Game3DScreen(BaseScreen):
             'enter': False
         }
         
-        # Timing
-        self.last_time = time.time()
+        # HUD
+        self.controls_hint_duration = 5.0  # Seconds the controls hint stays up
+        self.hud_refresh_interval = 0.1  # Seconds between position/velocity readout updates
+        self._hud_last_update = float('-inf')
+        self._hud_pos_text = ""
+        self._hud_vel_text = ""
+        self._player_hud_text = {}  # Player index -> (rounded values, pos text, vel text)
+        self._card_text_key = None  # Values the cached score card lines show
+        self._card_texts = ()
+        self._divider_list = None  # VS divider quads, compiled for _divider_size
+        self._divider_size = None
+        self._projection_matrices = {}  # Viewport (width, height) -> split-screen projection
+        
+        # Timing (physics advances in fixed steps, friction is tuned per 60 Hz step)
+        self.last_time = time.perf_counter()
+        self.physics_step = 1.0 / 60.0
+        self._step_accumulator = 0.0
         self._screen_just_entered = True  # Flag to detect when we enter this screen
         
+        # Compiled geometry, built on first draw once the GL context exists
+        self._box_lists = {}  # (width, height, depth) -> display list
+        self._ball_quadric = None
+        self._sphere_lists = {}  # Ball radius -> display list (no VBO support)
+        self._sphere_buffers = {}  # Ball radius -> (vertex buffer, vertex count)
+        self._sphere_vbo_supported = True
+        self._card_lists = None  # Unit score card (background, border) lists
+        self._material_lists = {}  # Material tuple -> display list
+        self._lighting_configured = False  # Light 0 parameters uploaded
+        
+        # Game over freeze frame (scene is static under the overlay)
+        self._frozen_scene_texture = None
+        self._frozen_scene_size = None  # Window size the snapshot was taken at
+        self._scene_frozen = False
+        
     def _create_platforms(self):
         """Create Fall Guys style platforms with movement"""
         platforms = []
@@ -170,29 +283,75 @@ class Game3DScreen(BaseScreen):
             if movement_type == 'horizontal':
                 platform.update({
                     'move_range': 3.0 + (i * 0.1),  # Increase range with level
-                    'move_speed': 1.0 + (i * 0.05)   # Increase speed with level
+                    'move_speed': 1.0 + (i * 0.05),  # Increase speed with level
+                    'phase': 0.0
                 })
             elif movement_type == 'tilt':
                 platform.update({
                     'tilt_angle': 0.0,
-                    'tilt_speed': 1.5 + (i * 0.05)
+                    'tilt_speed': 1.5 + (i * 0.05),
+                    'phase': 0.0
                 })
             elif movement_type == 'forward_back':
                 platform.update({
                     'move_range': 2.5 + (i * 0.08),
-                    'move_speed': 0.8 + (i * 0.04)
+                    'move_speed': 0.8 + (i * 0.04),
+                    'phase': 0.0
                 })
             elif movement_type == 'rotate_tilt':
                 platform.update({
                     'tilt_x': 0.0,
                     'tilt_z': 0.0,
-                    'tilt_speed': 1.2 + (i * 0.03)
+                    'tilt_speed': 1.2 + (i * 0.03),
+                    'phase': 0.0,
+                    'phase_z': 0.0  # The z tilt runs at 0.7x the x tilt rate
                 })
             
             platforms.append(platform)
         
+        # Bounding sphere radius (covers any tilt) for view culling
+        for platform in platforms:
+            platform['bound_radius'] = 0.5 * math.sqrt(
+                platform['width']**2 + platform['height']**2 + platform['depth']**2)
+        
         return platforms
         
+    def _build_platform_bounds(self):
+        """Lay out the per-frame platform state as parallel lists"""
+        # Live positions and velocities; the dicts keep the spawn pose and
+        # the fixed description (size, color, movement parameters)
+        self._plat_x = [platform['x'] for platform in self.platforms]
+        self._plat_y = [platform['y'] for platform in self.platforms]
+        self._plat_z = [platform['z'] for platform in self.platforms]
+        self._plat_vel_x = [0] * len(self.platforms)
+        self._plat_vel_z = [0] * len(self.platforms)
+        
+        # Collision extents, fixed since platforms only move in x and z
+        self._plat_half_w = [platform['width'] / 2 for platform in self.platforms]
+        self._plat_half_d = [platform['depth'] / 2 for platform in self.platforms]
+        self._plat_top = [platform['y'] + platform['height'] / 2 for platform in self.platforms]
+        self._plat_radius = [platform['bound_radius'] for platform in self.platforms]
+        
+        # Z range each platform can ever cover (forward_back ones sweep
+        # move_range either way), sorted so lookups only test nearby platforms
+        spans = []
+        for i, platform in enumerate(self.platforms):
+            reach = self._plat_half_d[i]
+            if platform['movement_type'] == 'forward_back':
+                reach += platform['move_range']
+            spans.append((platform['base_z'] - reach, platform['base_z'] + reach, i))
+        spans.sort()
+        self._z_span_starts = [start for start, end, i in spans]
+        self._z_span_order = [i for start, end, i in spans]
+        self._z_span_max = max(end - start for start, end, i in spans)
+        
+        # Platform indices by movement type, static platforms are in none
+        self._move_groups = {'horizontal': [], 'forward_back': [], 'tilt': [], 'rotate_tilt': []}
+        for i, platform in enumerate(self.platforms):
+            group = self._move_groups.get(platform['movement_type'])
+            if group is not None:
+                group.append(i)
+        
     def render(self):
         """Render the 3D game space"""
         # Reset game when first entering this screen if game was over
@@ -205,29 +364,51 @@ class Game3DScreen(BaseScreen):
         # Ensure mode reflects latest selection (Single vs Two Player)
         self.is_multiplayer = (game_settings.get_game_mode() == 1)
             
-        current_time = time.time()
+        current_time = time.perf_counter()
         dt = min(current_time - self.last_time, 0.1)  # Cap delta time
         self.last_time = current_time
         
-        # Update game logic
-        self._update_game(dt)
+        # Update game logic in fixed steps (the world stands still once the game is over)
+        if not self.game_over:
+            self._step_accumulator += dt
+            step = self.physics_step
+            while self._step_accumulator >= step and not self.game_over:
+                self._update_game(step)
+                self._step_accumulator -= step
         
-        # Clear background
-        glClearColor(0.3, 0.6, 1.0, 1.0)  # Sky blue
+        # A snapshot from before a reshape no longer fits the window, retake it
+        if self._scene_frozen and self._frozen_scene_size != self.opengl_manager.get_window_size():
+            self._scene_frozen = False
         
         if not self.is_multiplayer:
             # Single player rendering path
+            if self.game_over and self._scene_frozen:
+                # Reuse the snapshot instead of redrawing every platform
+                self.opengl_manager.setup_2d_projection()
+                self.opengl_manager.draw_fullscreen_texture(self._frozen_scene_texture)
+                self._render_ui()
+                return
+            
             self.opengl_manager.setup_3d_projection()
             self._setup_lighting()
             self._update_camera()
             self._render_scene()
+            if self.game_over:
+                # Snapshot the last scene frame before the overlay goes on top
+                self._freeze_scene()
             self.opengl_manager.setup_2d_projection()
             self._render_ui()
             return
         
         # Multiplayer split screen
-        window_width = glutGet(GLUT_WINDOW_WIDTH)
-        window_height = glutGet(GLUT_WINDOW_HEIGHT)
+        window_width, window_height = self.opengl_manager.get_window_size()
+        if self.game_over and self._scene_frozen:
+            # Both views and their result text are final, reuse the whole frame
+            glViewport(0, 0, window_width, window_height)
+            self.opengl_manager.setup_2d_projection()
+            self.opengl_manager.draw_fullscreen_texture(self._frozen_scene_texture)
+            return
+        
         half_width = max(1, window_width // 2)
         
         # Left viewport (P1)
@@ -236,7 +417,6 @@ class Game3DScreen(BaseScreen):
         self._setup_lighting()
         self._update_camera_for_player(1)
         self._render_scene_for_player(1)
-        self._render_ui_for_player(1, half_width, window_height)
         
         # Clear depth buffer before rendering the second viewport
         glClear(GL_DEPTH_BUFFER_BIT)
@@ -247,22 +427,39 @@ class Game3DScreen(BaseScreen):
         self._setup_lighting()
         self._update_camera_for_player(2)
         self._render_scene_for_player(2)
-        self._render_ui_for_player(2, window_width - half_width, window_height)
         
-        # Render the divider line between the two viewports
+        # Both HUDs and the divider share one full-window 2D pass
+        self._begin_ui_2d(window_width, window_height)
+        self._render_ui_for_player(1, 0, half_width, window_height)
+        self._render_ui_for_player(2, half_width, window_width - half_width, window_height)
         self._render_multiplayer_divider(window_width, window_height)
+        self._end_ui_2d()
+        if self.game_over:
+            self._freeze_scene()
+    
+    def _freeze_scene(self):
+        """Snapshot the back buffer for the game over screen to redraw"""
+        self._frozen_scene_texture = self.opengl_manager.capture_frame_texture(self._frozen_scene_texture)
+        self._frozen_scene_size = self.opengl_manager.get_window_size()
+        self._scene_frozen = True
         
     def _update_game(self, dt):
         """Update game physics and logic"""
         # Update platform movements
         self._update_platform_movements(dt)
         
+        # Ground contact after the platforms moved, shared by input and physics
+        self._contact_platform_idx = self._find_ground_platform(
+            self._platforms_under(self.ball_x, self.ball_z), self.ball_y - self.ball_radius)
+        
         if not self.is_multiplayer:
             self._handle_input(dt)
             self._update_physics(dt)
             return
         
         # Multiplayer: update both players
+        self._contact_platform_idx_p2 = self._find_ground_platform(
+            self._platforms_under(self.ball2_x, self.ball2_z), self.ball2_y - self.ball2_radius)
         self._handle_input(dt)
         self._handle_input_p2(dt)
         self._update_physics(dt)
@@ -270,59 +467,52 @@ class Game3DScreen(BaseScreen):
         
     def _update_platform_movements(self, dt):
         """Update moving and tilting platforms"""
-        current_time = time.time()
-        
-        for platform in self.platforms:
-            movement_type = platform.get('movement_type', 'static')
+        sin, cos = math.sin, math.cos  # Local names, looked up for every platform
+        tau = math.tau
+        platforms = self.platforms
+        groups = self._move_groups
+        plat_x, plat_z = self._plat_x, self._plat_z
+        plat_vel_x, plat_vel_z = self._plat_vel_x, self._plat_vel_z
+        
+        # Each platform advances its own phase, kept in [0, 2pi) so the
+        # sin argument stays small however long the game runs. Only the
+        # moving component of each platform velocity ever changes, the rest
+        # stays at the zero set in _build_platform_bounds
+        
+        # Move side to side
+        for i in groups['horizontal']:
+            platform = platforms[i]
+            phase = platform['phase'] = (platform['phase'] + platform['move_speed'] * dt) % tau
+            x = platform['base_x'] + sin(phase) * platform['move_range']
             
-            # Store previous position for velocity calculation
-            prev_x = platform.get('x', 0)
-            prev_z = platform.get('z', 0)
+            # Calculate velocity from the previous position
+            plat_vel_x[i] = (x - plat_x[i]) / dt if dt > 0 else 0
+            plat_x[i] = x
+        
+        # Move forward and back
+        for i in groups['forward_back']:
+            platform = platforms[i]
+            phase = platform['phase'] = (platform['phase'] + platform['move_speed'] * dt) % tau
+            z = platform['base_z'] + sin(phase) * platform['move_range']
             
-            if movement_type == 'horizontal':
-                # Move side to side
-                move_range = platform['move_range']
-                move_speed = platform['move_speed']
-                base_x = platform['base_x']
-                
-                offset = math.sin(current_time * move_speed) * move_range
-                platform['x'] = base_x + offset
-                
-                # Calculate velocity
-                platform['vel_x'] = (platform['x'] - prev_x) / dt if dt > 0 else 0
-                platform['vel_z'] = 0
-                
-            elif movement_type == 'forward_back':
-                # Move forward and back
-                move_range = platform['move_range']
-                move_speed = platform['move_speed']
-                base_z = platform['base_z']
-                
-                offset = math.sin(current_time * move_speed) * move_range
-                platform['z'] = base_z + offset
-                
-                # Calculate velocity
-                platform['vel_x'] = 0
-                platform['vel_z'] = (platform['z'] - prev_z) / dt if dt > 0 else 0
-                
-            elif movement_type == 'tilt':
-                # Tilt back and forth
-                tilt_speed = platform['tilt_speed']
-                platform['tilt_angle'] = math.sin(current_time * tilt_speed) * 0.3  # Max 0.3 radians (about 17 degrees)
-                platform['vel_x'] = 0
-                platform['vel_z'] = 0
-                
-            elif movement_type == 'rotate_tilt':
-                # Complex tilting in multiple directions
-                tilt_speed = platform['tilt_speed']
-                platform['tilt_x'] = math.sin(current_time * tilt_speed) * 0.25
-                platform['tilt_z'] = math.cos(current_time * tilt_speed * 0.7) * 0.25
-                platform['vel_x'] = 0
-                platform['vel_z'] = 0
-            else:
-                # Static platform
-                platform['vel_x'] = 0
-                platform['vel_z'] = 0
+            # Calculate velocity from the previous position
+            plat_vel_z[i] = (z - plat_z[i]) / dt if dt > 0 else 0
+            plat_z[i] = z
+        
+        # Tilt back and forth
+        for i in groups['tilt']:
+            platform = platforms[i]
+            phase = platform['phase'] = (platform['phase'] + platform['tilt_speed'] * dt) % tau
+            platform['tilt_angle'] = sin(phase) * 0.3  # Max 0.3 radians (about 17 degrees)
+        
+        # Complex tilting in multiple directions
+        for i in groups['rotate_tilt']:
+            platform = platforms[i]
+            tilt_step = platform['tilt_speed'] * dt
+            phase = platform['phase'] = (platform['phase'] + tilt_step) % tau
+            phase_z = platform['phase_z'] = (platform['phase_z'] + tilt_step * 0.7) % tau
+            platform['tilt_x'] = sin(phase) * 0.25
+            platform['tilt_z'] = cos(phase_z) * 0.25
         
     def _handle_input(self, dt):
         """Handle player input with acceleration"""
@@ -330,25 +520,24 @@ class Game3DScreen(BaseScreen):
         if self.is_multiplayer and self.game_ended:
             return
             
-        # Movement forces using acceleration
-        if self.keys_pressed['w']:
-            self.ball_vel_z -= self.acceleration * dt
-        if self.keys_pressed['s']:
-            self.ball_vel_z += self.acceleration * dt
-        if self.keys_pressed['a']:
-            self.ball_vel_x -= self.acceleration * dt
-        if self.keys_pressed['d']:
-            self.ball_vel_x += self.acceleration * dt
+        # Movement forces using acceleration, opposite keys cancel out
+        keys = self.keys_pressed
+        move_x = keys['d'] - keys['a']
+        move_z = keys['s'] - keys['w']
+        if move_x or move_z:
+            step = self.acceleration * dt
+            self.ball_vel_x += step * move_x
+            self.ball_vel_z += step * move_z
             
-        # Limit maximum horizontal speed
-        horizontal_speed = math.sqrt(self.ball_vel_x**2 + self.ball_vel_z**2)
-        if horizontal_speed > self.max_speed:
-            scale = self.max_speed / horizontal_speed
-            self.ball_vel_x *= scale
-            self.ball_vel_z *= scale
+            # Limit maximum horizontal speed (only input can push past it)
+            speed_sq = self.ball_vel_x * self.ball_vel_x + self.ball_vel_z * self.ball_vel_z
+            if speed_sq > self._max_speed_sq:
+                scale = self.max_speed / math.sqrt(speed_sq)
+                self.ball_vel_x *= scale
+                self.ball_vel_z *= scale
             
         # Jumping
-        if self.keys_pressed[' '] and self._is_on_ground():
+        if keys[' '] and self._contact_platform_idx >= 0:
             self.ball_vel_y = self.jump_force
     
     def _handle_input_p2(self, dt):
@@ -360,22 +549,21 @@ class Game3DScreen(BaseScreen):
         if self.game_ended:
             return
             
-        if self.keys_pressed_p2['up']:
-            self.ball2_vel_z -= self.acceleration * dt
-        if self.keys_pressed_p2['down']:
-            self.ball2_vel_z += self.acceleration * dt
-        if self.keys_pressed_p2['left']:
-            self.ball2_vel_x -= self.acceleration * dt
-        if self.keys_pressed_p2['right']:
-            self.ball2_vel_x += self.acceleration * dt
-        
-        horizontal_speed = math.sqrt(self.ball2_vel_x**2 + self.ball2_vel_z**2)
-        if horizontal_speed > self.max_speed:
-            scale = self.max_speed / horizontal_speed
-            self.ball2_vel_x *= scale
-            self.ball2_vel_z *= scale
-        
-        if self.keys_pressed_p2['enter'] and self._is_on_ground_p2():
+        keys = self.keys_pressed_p2
+        move_x = keys['right'] - keys['left']
+        move_z = keys['down'] - keys['up']
+        if move_x or move_z:
+            step = self.acceleration * dt
+            self.ball2_vel_x += step * move_x
+            self.ball2_vel_z += step * move_z
+            
+            speed_sq = self.ball2_vel_x * self.ball2_vel_x + self.ball2_vel_z * self.ball2_vel_z
+            if speed_sq > self._max_speed_sq:
+                scale = self.max_speed / math.sqrt(speed_sq)
+                self.ball2_vel_x *= scale
+                self.ball2_vel_z *= scale
+        
+        if keys['enter'] and self._contact_platform_idx_p2 >= 0:
             self.ball2_vel_y = self.jump_force
             
     def _update_physics(self, dt):
@@ -383,40 +571,19 @@ class Game3DScreen(BaseScreen):
         if self.game_over or (self.is_multiplayer and self.game_ended):
             return
             
-        # Update game timer
-        self.game_time = time.time() - self.start_time
-            
-        # Apply gravity
-        self.ball_vel_y += self.gravity * dt
-        
-        # Apply friction and rolling resistance
-        if self._is_on_ground():
-            # Ground friction
-            self.ball_vel_x *= self.ground_friction
-            self.ball_vel_z *= self.ground_friction
+        # Update game timer from the frame's timestamp
+        self.game_time = self.last_time - self.start_time
             
-            # Rolling resistance (simulates ball rolling on surface)
-            speed = math.sqrt(self.ball_vel_x**2 + self.ball_vel_z**2)
-            if speed > 0:
-                resistance_force = self.rolling_resistance * dt
-                resistance_scale = max(0, 1 - resistance_force / speed)
-                self.ball_vel_x *= resistance_scale
-                self.ball_vel_z *= resistance_scale
-        else:
-            # Air friction
-            self.ball_vel_x *= self.air_friction
-            self.ball_vel_z *= self.air_friction
-            
-        # Update position
-        self.ball_x += self.ball_vel_x * dt
-        self.ball_y += self.ball_vel_y * dt
-        self.ball_z += self.ball_vel_z * dt
-        
-        # Platform collision
-        self._handle_platform_collision()
+        # Gravity, friction and position
+        (self.ball_x, self.ball_y, self.ball_z,
+         self.ball_vel_x, self.ball_vel_y, self.ball_vel_z) = _integrate_ball(
+            self.ball_x, self.ball_y, self.ball_z,
+            self.ball_vel_x, self.ball_vel_y, self.ball_vel_z,
+            self._contact_platform_idx >= 0, dt, self.gravity,
+            self.ground_friction, self.air_friction, self.rolling_resistance)
         
-        # Apply platform movement to ball if on a moving platform
-        self._apply_platform_movement(dt)
+        # Platform collision and carrying by moving platforms
+        self._resolve_contact(dt)
         
         # Update score based on platform reached
         self._update_score()
@@ -440,27 +607,15 @@ class Game3DScreen(BaseScreen):
         if not self.is_multiplayer or self.game_over_p2 or self.game_ended:
             return
         
-        self.game_time = time.time() - self.start_time
-        self.ball2_vel_y += self.gravity * dt
-        if self._is_on_ground_p2():
-            self.ball2_vel_x *= self.ground_friction
-            self.ball2_vel_z *= self.ground_friction
-            speed = math.sqrt(self.ball2_vel_x**2 + self.ball2_vel_z**2)
-            if speed > 0:
-                resistance_force = self.rolling_resistance * dt
-                resistance_scale = max(0, 1 - resistance_force / speed)
-                self.ball2_vel_x *= resistance_scale
-                self.ball2_vel_z *= resistance_scale
-        else:
-            self.ball2_vel_x *= self.air_friction
-            self.ball2_vel_z *= self.air_friction
-        
-        self.ball2_x += self.ball2_vel_x * dt
-        self.ball2_y += self.ball2_vel_y * dt
-        self.ball2_z += self.ball2_vel_z * dt
+        self.game_time = self.last_time - self.start_time
+        (self.ball2_x, self.ball2_y, self.ball2_z,
+         self.ball2_vel_x, self.ball2_vel_y, self.ball2_vel_z) = _integrate_ball(
+            self.ball2_x, self.ball2_y, self.ball2_z,
+            self.ball2_vel_x, self.ball2_vel_y, self.ball2_vel_z,
+            self._contact_platform_idx_p2 >= 0, dt, self.gravity,
+            self.ground_friction, self.air_friction, self.rolling_resistance)
         
-        self._handle_platform_collision_p2()
-        self._apply_platform_movement_p2(dt)
+        self._resolve_contact_p2(dt)
         self._update_score_p2()
         
         if self.ball2_y < self.death_y:
@@ -512,252 +667,242 @@ class Game3DScreen(BaseScreen):
         
         print(self.winner_reason)
             
-    def _handle_platform_collision(self):
-        """Handle collision with platforms with bounce physics"""
-        for platform in self.platforms:
-            # Check if ball is above platform
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            
-            # Check if ball is within platform bounds horizontally
-            if (px - pw/2 <= self.ball_x <= px + pw/2 and
-                pz - pd/2 <= self.ball_z <= pz + pd/2):
-                
-                # Check if ball is colliding from above
-                platform_top = py + ph/2
-                ball_bottom = self.ball_y - self.ball_radius
-                
-                if (ball_bottom <= platform_top and 
-                    ball_bottom >= platform_top - 1.0 and  # Some tolerance
-                    self.ball_vel_y <= 0):  # Only when falling
-                    
-                    self.ball_y = platform_top + self.ball_radius
-                    
-                    # Add bounce effect if falling fast enough
-                    if self.ball_vel_y < -2.0:  # Only bounce if falling fast
-                        self.ball_vel_y = -self.ball_vel_y * self.bounce_damping
-                    else:
-                        self.ball_vel_y = 0
-                    
-                    return  # Stop checking other platforms
+    def _platforms_under(self, ball_x, ball_z):
+        """Indices (in platform order) of the platforms whose top face spans (x, z)"""
+        # Only platforms whose z range can reach the ball are tested
+        first = bisect_left(self._z_span_starts, ball_z - self._z_span_max)
+        last = bisect_right(self._z_span_starts, ball_z)
+        
+        plat_x, plat_z = self._plat_x, self._plat_z
+        half_w, half_d = self._plat_half_w, self._plat_half_d
+        hits = []
+        for i in self._z_span_order[first:last]:
+            px, pz = plat_x[i], plat_z[i]
+            if (px - half_w[i] <= ball_x <= px + half_w[i] and
+                pz - half_d[i] <= ball_z <= pz + half_d[i]):
+                hits.append(i)
+        if len(hits) > 1:
+            hits.sort()
+        return hits
     
-    def _handle_platform_collision_p2(self):
-        """Handle collision for P2 with bounce physics"""
-        for platform in self.platforms:
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            if (px - pw/2 <= self.ball2_x <= px + pw/2 and
-                pz - pd/2 <= self.ball2_z <= pz + pd/2):
-                platform_top = py + ph/2
-                ball_bottom = self.ball2_y - self.ball2_radius
-                if (ball_bottom <= platform_top and
-                    ball_bottom >= platform_top - 1.0 and
-                    self.ball2_vel_y <= 0):
-                    self.ball2_y = platform_top + self.ball2_radius
-                    if self.ball2_vel_y < -2.0:
-                        self.ball2_vel_y = -self.ball2_vel_y * self.bounce_damping
-                    else:
-                        self.ball2_vel_y = 0
-                    return
-                
-    def _is_on_ground(self):
-        """Check if ball is on any platform"""
-        for platform in self.platforms:
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            
-            # Check if ball is within platform bounds horizontally
-            if (px - pw/2 <= self.ball_x <= px + pw/2 and
-                pz - pd/2 <= self.ball_z <= pz + pd/2):
-                
-                # Check if ball is on top of platform
-                platform_top = py + ph/2
+    def _find_ground_platform(self, platforms, ball_bottom):
+        """Index of the first of platforms (from _platforms_under) the ball bottom rests on, or -1"""
+        plat_top = self._plat_top
+        for i in platforms:
+            if abs(ball_bottom - plat_top[i]) < 0.1:
+                return i
+        return -1
+    
+    def _find_landing_platform(self, platforms, ball_bottom):
+        """Index of the first of platforms the ball bottom has sunk into from above, or -1"""
+        plat_top = self._plat_top
+        for i in platforms:
+            platform_top = plat_top[i]
+            if platform_top - 1.0 <= ball_bottom <= platform_top:  # Some tolerance
+                return i
+        return -1
+    
+    def _resolve_contact(self, dt):
+        """Land the ball on a platform, carry it with that platform and cache the contact"""
+        # One lookup serves landing, ground contact and scoring unless the ball is carried
+        under = self._platforms_under(self.ball_x, self.ball_z)
+        ball_bottom = self.ball_y - self.ball_radius
+        
+        # Snap onto the platform it fell into, with bounce physics
+        if self.ball_vel_y <= 0:  # Only when falling
+            i = self._find_landing_platform(under, ball_bottom)
+            if i >= 0:
+                self.ball_y = self._plat_top[i] + self.ball_radius
                 ball_bottom = self.ball_y - self.ball_radius
                 
-                if abs(ball_bottom - platform_top) < 0.1:
-                    return True
-        return False
+                # Add bounce effect if falling fast enough
+                if self.ball_vel_y < -2.0:  # Only bounce if falling fast
+                    self.ball_vel_y = -self.ball_vel_y * self.bounce_damping
+                else:
+                    self.ball_vel_y = 0
+        
+        i = self._find_ground_platform(under, ball_bottom)
+        if i >= 0 and (self._plat_vel_x[i] or self._plat_vel_z[i]):
+            # Move ball with platform (with some resistance to feel natural)
+            self.ball_x += self._plat_vel_x[i] * dt * 0.8  # 80% coupling
+            self.ball_z += self._plat_vel_z[i] * dt * 0.8
+            
+            # Stay on the carrying platform unless it moved the ball past its edge
+            under = self._platforms_under(self.ball_x, self.ball_z)
+            if i not in under:
+                i = self._find_ground_platform(under, ball_bottom)
+        self._contact_platform_idx = i
+        self._contact_platforms = under
     
-    def _is_on_ground_p2(self):
-        """Check if P2 ball is on any platform"""
-        for platform in self.platforms:
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            if (px - pw/2 <= self.ball2_x <= px + pw/2 and
-                pz - pd/2 <= self.ball2_z <= pz + pd/2):
-                platform_top = py + ph/2
+    def _resolve_contact_p2(self, dt):
+        """Land the P2 ball on a platform, carry it with that platform and cache the contact"""
+        under = self._platforms_under(self.ball2_x, self.ball2_z)
+        ball_bottom = self.ball2_y - self.ball2_radius
+        if self.ball2_vel_y <= 0:
+            i = self._find_landing_platform(under, ball_bottom)
+            if i >= 0:
+                self.ball2_y = self._plat_top[i] + self.ball2_radius
                 ball_bottom = self.ball2_y - self.ball2_radius
-                if abs(ball_bottom - platform_top) < 0.1:
-                    return True
-        return False
-        
+                if self.ball2_vel_y < -2.0:
+                    self.ball2_vel_y = -self.ball2_vel_y * self.bounce_damping
+                else:
+                    self.ball2_vel_y = 0
+        i = self._find_ground_platform(under, ball_bottom)
+        if i >= 0 and (self._plat_vel_x[i] or self._plat_vel_z[i]):
+            self.ball2_x += self._plat_vel_x[i] * dt * 0.8
+            self.ball2_z += self._plat_vel_z[i] * dt * 0.8
+            under = self._platforms_under(self.ball2_x, self.ball2_z)
+            if i not in under:
+                i = self._find_ground_platform(under, ball_bottom)
+        self._contact_platform_idx_p2 = i
+        self._contact_platforms_p2 = under
+                
     def _update_score(self):
         """Update score based on platforms reached"""
-        for i, platform in enumerate(self.platforms):
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            
-            # Check if ball is on this platform
-            if (px - pw/2 <= self.ball_x <= px + pw/2 and
-                pz - pd/2 <= self.ball_z <= pz + pd/2 and
-                self._is_on_ground()):
-                
-                # If this platform hasn't been reached before, award points
-                if i not in self.platforms_reached:
-                    self.platforms_reached.add(i)
-                    points = (i + 1) * 100  # More points for later platforms
-                    self.score += points
-                    print(f"Platform {i+1} reached! +{points} points (Total: {self.score})")
-                    
-                    # Check if all platforms completed
-                    if len(self.platforms_reached) == len(self.platforms):
-                        completion_bonus = 1000
-                        self.score += completion_bonus
-                        completion_time = self.game_time
-                        
-                        # Update best time
-                        if completion_time < self.best_time:
-                            self.best_time = completion_time
-                            print(f"New Best Time: {self.best_time:.1f}s!")
-                        
-                        print(f"All platforms completed! +{completion_bonus} bonus points!")
-                        print(f"Final Score: {self.score} | Time: {completion_time:.1f}s")
-    
-    def _update_score_p2(self):
-        """Update P2 score based on platforms reached"""
-        for i, platform in enumerate(self.platforms):
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            if (px - pw/2 <= self.ball2_x <= px + pw/2 and
-                pz - pd/2 <= self.ball2_z <= pz + pd/2 and
-                self._is_on_ground_p2()):
-                if i not in self.platforms_reached_p2:
-                    self.platforms_reached_p2.add(i)
-                    points = (i + 1) * 100
-                    self.score_p2 += points
-                    print(f"[P2] Platform {i+1} reached! +{points} points (Total: {self.score_p2})")
-                    if len(self.platforms_reached_p2) == len(self.platforms):
-                        completion_bonus = 1000
-                        self.score_p2 += completion_bonus
-                        completion_time = self.game_time
-                        if completion_time < self.best_time_p2:
-                            self.best_time_p2 = completion_time
-                            print(f"[P2] New Best Time: {self.best_time_p2:.1f}s!")
-                        print(f"[P2] All platforms completed! +{completion_bonus} bonus points!")
-                        print(f"[P2] Final Score: {self.score_p2} | Time: {completion_time:.1f}s")
-        
-    def _apply_platform_movement(self, dt):
-        """Apply platform movement to ball when standing on a moving platform"""
-        if not self._is_on_ground():
+        # Nothing can be scored mid-air or once every platform is reached
+        if self.platforms_reached_mask == self._all_platforms_mask or self._contact_platform_idx < 0:
             return
             
-        # Find which platform the ball is on
-        for platform in self.platforms:
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            
-            # Check if ball is on this platform
-            if (px - pw/2 <= self.ball_x <= px + pw/2 and
-                pz - pd/2 <= self.ball_z <= pz + pd/2):
-                
-                # Check if ball is on top of platform
-                platform_top = py + ph/2
-                ball_bottom = self.ball_y - self.ball_radius
+        for i in self._contact_platforms:
+            # Platforms that were already reached never score again
+            if not (self.platforms_reached_mask >> i) & 1:
+                # Award points for the newly reached platform
+                self.platforms_reached_mask |= 1 << i
+                self.platforms_reached_count += 1
+                points = (i + 1) * 100  # More points for later platforms
+                self.score += points
+                print(f"Platform {i+1} reached! +{points} points (Total: {self.score})")
                 
-                if abs(ball_bottom - platform_top) < 0.1:
-                    # Apply platform velocity to ball
-                    platform_vel_x = platform.get('vel_x', 0)
-                    platform_vel_z = platform.get('vel_z', 0)
+                # Check if all platforms completed
+                if self.platforms_reached_mask == self._all_platforms_mask:
+                    completion_bonus = 1000
+                    self.score += completion_bonus
+                    completion_time = self.game_time
                     
-                    # Move ball with platform (with some resistance to feel natural)
-                    self.ball_x += platform_vel_x * dt * 0.8  # 80% coupling
-                    self.ball_z += platform_vel_z * dt * 0.8
+                    # Update best time
+                    if completion_time < self.best_time:
+                        self.best_time = completion_time
+                        print(f"New Best Time: {self.best_time:.1f}s!")
                     
-                    return  # Only apply movement from one platform
+                    print(f"All platforms completed! +{completion_bonus} bonus points!")
+                    print(f"Final Score: {self.score} | Time: {completion_time:.1f}s")
     
-    def _apply_platform_movement_p2(self, dt):
-        """Apply platform movement to P2 ball"""
-        if not self._is_on_ground_p2():
+    def _update_score_p2(self):
+        """Update P2 score based on platforms reached"""
+        if self.platforms_reached_mask_p2 == self._all_platforms_mask or self._contact_platform_idx_p2 < 0:
             return
-        for platform in self.platforms:
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            if (px - pw/2 <= self.ball2_x <= px + pw/2 and
-                pz - pd/2 <= self.ball2_z <= pz + pd/2):
-                platform_top = py + ph/2
-                ball_bottom = self.ball2_y - self.ball2_radius
-                if abs(ball_bottom - platform_top) < 0.1:
-                    platform_vel_x = platform.get('vel_x', 0)
-                    platform_vel_z = platform.get('vel_z', 0)
-                    self.ball2_x += platform_vel_x * dt * 0.8
-                    self.ball2_z += platform_vel_z * dt * 0.8
-                    return
+        for i in self._contact_platforms_p2:
+            if not (self.platforms_reached_mask_p2 >> i) & 1:
+                self.platforms_reached_mask_p2 |= 1 << i
+                self.platforms_reached_count_p2 += 1
+                points = (i + 1) * 100
+                self.score_p2 += points
+                print(f"[P2] Platform {i+1} reached! +{points} points (Total: {self.score_p2})")
+                if self.platforms_reached_mask_p2 == self._all_platforms_mask:
+                    completion_bonus = 1000
+                    self.score_p2 += completion_bonus
+                    completion_time = self.game_time
+                    if completion_time < self.best_time_p2:
+                        self.best_time_p2 = completion_time
+                        print(f"[P2] New Best Time: {self.best_time_p2:.1f}s!")
+                    print(f"[P2] All platforms completed! +{completion_bonus} bonus points!")
+                    print(f"[P2] Final Score: {self.score_p2} | Time: {completion_time:.1f}s")
+        
+    def _load_view_matrix(self, camera_x, camera_y, camera_z):
+        """Load the follow camera view (what gluLookAt at the ball would build)"""
+        up_y, up_z = self._view_up
+        back_y, back_z = self._view_back
+        view = self._view_matrix
+        view[12] = -camera_x
+        view[13] = -(up_y * camera_y + up_z * camera_z)
+        view[14] = -(back_y * camera_y + back_z * camera_z)
+        glLoadMatrixf(view)
         
     def _update_camera(self):
         """Update camera to follow the ball"""
-        glLoadIdentity()
-        
         # Camera follows ball
         camera_x = self.ball_x
         camera_y = self.ball_y + self.camera_height
         camera_z = self.ball_z + self.camera_distance
+        window_width, window_height = self.opengl_manager.get_window_size()
+        self._view_aspect = window_width / window_height
+        self._view_eye = (camera_x, camera_y, camera_z)
         
-        gluLookAt(camera_x, camera_y, camera_z,  # Camera position
-                  self.ball_x, self.ball_y, self.ball_z,  # Look at ball
-                  0, 1, 0)  # Up vector
+        self._load_view_matrix(camera_x, camera_y, camera_z)
                   
     def _setup_lighting(self):
-        """Setup basic lighting"""
+        """Setup basic lighting (the light itself is only configured once)"""
         glEnable(GL_LIGHTING)
         glEnable(GL_LIGHT0)
         glEnable(GL_DEPTH_TEST)
+        if self._lighting_configured:
+            return
+        self._lighting_configured = True
         
-        # Light position
+        # Light position (eye space, the modelview is still the identity here)
         light_pos = [10.0, 10.0, 10.0, 1.0]
         glLightfv(GL_LIGHT0, GL_POSITION, light_pos)
         
         # Light properties
-        glLightfv(GL_LIGHT0, GL_AMBIENT, [0.3, 0.3, 0.3, 1.0])
+        glLightfv(GL_LIGHT0, GL_AMBIENT, LIGHT_AMBIENT)
         glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
         glLightfv(GL_LIGHT0, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
         
+        # Platforms set their material with a single glColor
+        glColorMaterial(GL_FRONT, GL_AMBIENT_AND_DIFFUSE)
+        
+        # Sky blue background for the engine's clear
+        glClearColor(0.3, 0.6, 1.0, 1.0)
+        
     def _render_scene(self):
         """Render the 3D scene"""
+        # Boxes and the ball are closed and wound counter-clockwise, skip
+        # their back faces (the 2D UI flips winding, so only for the scene)
+        glEnable(GL_CULL_FACE)
+        
         # Draw the infinite platform
         self._draw_platform()
         
         # Draw the ball
         self._draw_ball()
+        
+        glDisable(GL_CULL_FACE)
 
     def _render_scene_for_player(self, player_index):
         """Render scene for specified player (platforms + that player's ball)"""
+        glEnable(GL_CULL_FACE)
         self._draw_platform()
         if player_index == 1:
             self._draw_ball()
         else:
             glPushMatrix()
             glTranslatef(self.ball2_x, self.ball2_y, self.ball2_z)
-            glMaterialfv(GL_FRONT, GL_AMBIENT, [0.8, 0.2, 0.2, 1.0])
-            glMaterialfv(GL_FRONT, GL_DIFFUSE, [1.0, 0.4, 0.4, 1.0])
-            glMaterialfv(GL_FRONT, GL_SPECULAR, [1.0, 0.8, 0.8, 1.0])
-            glMaterialf(GL_FRONT, GL_SHININESS, 50.0)
-            quadric = gluNewQuadric()
-            gluSphere(quadric, self.ball2_radius, 20, 20)
-            gluDeleteQuadric(quadric)
+            self._apply_material(BALL2_MATERIAL)
+            self._draw_sphere(self.ball2_radius)
             glPopMatrix()
+        glDisable(GL_CULL_FACE)
 
     def _setup_perspective_for_viewport(self, width, height):
         """Set perspective according to viewport size"""
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
         aspect = float(max(1, width)) / float(max(1, height))
-        gluPerspective(45, aspect, 0.1, 1000.0)
+        self._view_aspect = aspect
+        
+        # The matrix only depends on the viewport size, build it with GLU once per size
+        projection = self._projection_matrices.get((width, height))
+        if projection is None:
+            glLoadIdentity()
+            gluPerspective(self.camera_fov, aspect, 0.1, self.camera_far)
+            projection = (GLdouble * 16)()
+            glGetDoublev(GL_PROJECTION_MATRIX, projection)
+            self._projection_matrices[(width, height)] = projection
+        else:
+            glLoadMatrixd(projection)
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
 
     def _update_camera_for_player(self, player_index):
         """Update camera for specific player"""
-        glLoadIdentity()
         if player_index == 1:
             cx, cy, cz = self.ball_x, self.ball_y, self.ball_z
         else:
@@ -765,92 +910,161 @@ class Game3DScreen(BaseScreen):
         camera_x = cx
         camera_y = cy + self.camera_height
         camera_z = cz + self.camera_distance
-        gluLookAt(camera_x, camera_y, camera_z,
-                  cx, cy, cz,
-                  0, 1, 0)
+        self._view_eye = (camera_x, camera_y, camera_z)
+        self._load_view_matrix(camera_x, camera_y, camera_z)
         
     def _draw_platform(self):
         """Draw Fall Guys style platforms with movement and tilting"""
         glEnable(GL_LIGHTING)
         
+        # View frustum of the follow camera
+        ex, ey, ez = self._view_eye
+        up_y, up_z = self._view_up
+        back_y, back_z = self._view_back
+        tan_v = math.tan(math.radians(self.camera_fov / 2))
+        tan_h = tan_v * self._view_aspect
+        sec_v = math.sqrt(1 + tan_v * tan_v)
+        sec_h = math.sqrt(1 + tan_h * tan_h)
+        far = self.camera_far
+        
+        # Shared platform material, the color of each platform does the rest
+        glMaterialfv(GL_FRONT, GL_SPECULAR, PLATFORM_SPECULAR)
+        glMaterialf(GL_FRONT, GL_SHININESS, 20.0)
+        glLightfv(GL_LIGHT0, GL_AMBIENT, PLATFORM_LIGHT_AMBIENT)
+        glLightModelfv(GL_LIGHT_MODEL_AMBIENT, PLATFORM_MODEL_AMBIENT)
+        glEnable(GL_COLOR_MATERIAL)
+        
+        # GL entry points as locals, looked up for every platform
+        push_matrix, pop_matrix = glPushMatrix, glPopMatrix
+        translate, rotate, call_list = glTranslatef, glRotatef, glCallList
+        degrees = math.degrees
+        
         # Draw all platforms
-        for i, platform in enumerate(self.platforms):
-            px, py, pz = platform['x'], platform['y'], platform['z']
-            pw, ph, pd = platform['width'], platform['height'], platform['depth']
-            color = platform['color']
-            movement_type = platform.get('movement_type', 'static')
+        platforms = self.platforms
+        plat_x, plat_y, plat_z = self._plat_x, self._plat_y, self._plat_z
+        for i, radius in enumerate(self._plat_radius):
+            px, py, pz = plat_x[i], plat_y[i], plat_z[i]
             
-            glPushMatrix()
-            glTranslatef(px, py, pz)
+            # Skip platforms whose bounding sphere is outside the frustum
+            rx, ry, rz = px - ex, py - ey, pz - ez
+            forward = -(ry * back_y + rz * back_z)
+            if forward < -radius or forward > far + radius:
+                continue
+            up = ry * up_y + rz * up_z
+            if abs(rx) > forward * tan_h + radius * sec_h or abs(up) > forward * tan_v + radius * sec_v:
+                continue
+            
+            # Only visible platforms touch their description dict
+            platform = platforms[i]
+            movement_type = platform['movement_type']
+            
+            push_matrix()
+            translate(px, py, pz)
             
             # Apply tilting rotations
             if movement_type == 'tilt':
-                tilt_angle = platform.get('tilt_angle', 0.0)
-                glRotatef(math.degrees(tilt_angle), 0, 0, 1)  # Tilt around Z axis
+                tilt_angle = platform['tilt_angle']
+                rotate(degrees(tilt_angle), 0, 0, 1)  # Tilt around Z axis
                 
             elif movement_type == 'rotate_tilt':
-                tilt_x = platform.get('tilt_x', 0.0)
-                tilt_z = platform.get('tilt_z', 0.0)
-                glRotatef(math.degrees(tilt_x), 1, 0, 0)  # Tilt around X axis
-                glRotatef(math.degrees(tilt_z), 0, 0, 1)  # Tilt around Z axis
-            
-            # Set platform material
-            glMaterialfv(GL_FRONT, GL_AMBIENT, [color[0]*0.3, color[1]*0.3, color[2]*0.3, 1.0])
-            glMaterialfv(GL_FRONT, GL_DIFFUSE, [color[0], color[1], color[2], 1.0])
-            glMaterialfv(GL_FRONT, GL_SPECULAR, [0.5, 0.5, 0.5, 1.0])
-            glMaterialf(GL_FRONT, GL_SHININESS, 20.0)
+                tilt_x = platform['tilt_x']
+                tilt_z = platform['tilt_z']
+                rotate(degrees(tilt_x), 1, 0, 0)  # Tilt around X axis
+                rotate(degrees(tilt_z), 0, 0, 1)  # Tilt around Z axis
             
-            # Draw platform as a box
-            glScalef(pw, ph, pd)
-            self._draw_cube()
+            # Color and box replay from the platform's own list
+            display_list = platform.get('display_list')
+            if display_list is None:
+                display_list = self._get_platform_list(platform)
+            call_list(display_list)
             
-            glPopMatrix()
+            pop_matrix()
+        
+        # Back to explicit materials and the full ambient light for the balls
+        glDisable(GL_COLOR_MATERIAL)
+        glLightfv(GL_LIGHT0, GL_AMBIENT, LIGHT_AMBIENT)
+        glLightModelfv(GL_LIGHT_MODEL_AMBIENT, MODEL_AMBIENT)
             
-    def _draw_cube(self):
-        """Draw a unit cube"""
+    def _draw_platform_box(self, platform):
+        """Set the platform color (tracked as material) and draw its box at the current transform"""
+        # Set platform material
+        glColor3f(*platform['color'])
+        
+        # Draw platform as a box
+        glCallList(self._get_box_list(platform['width'], platform['height'], platform['depth']))
+        
+    def _get_platform_list(self, platform):
+        """Get (compiling on first use) the color and box display list of a platform"""
+        display_list = platform.get('display_list')
+        if display_list is None:
+            # Compile the box first, lists cannot be compiled while nested
+            self._get_box_list(platform['width'], platform['height'], platform['depth'])
+            display_list = glGenLists(1)
+            glNewList(display_list, GL_COMPILE)
+            self._draw_platform_box(platform)
+            glEndList()
+            platform['display_list'] = display_list
+        return display_list
+        
+    def _get_box_list(self, width, height, depth):
+        """Get (compiling on first use) the display list of a box of this size"""
+        key = (width, height, depth)
+        box_list = self._box_lists.get(key)
+        if box_list is None:
+            box_list = glGenLists(1)
+            glNewList(box_list, GL_COMPILE)
+            self._emit_box(width, height, depth)
+            glEndList()
+            self._box_lists[key] = box_list
+        return box_list
+        
+    def _emit_box(self, width, height, depth):
+        """Emit a box centered on the origin in immediate mode"""
+        x, y, z = width / 2, height / 2, depth / 2
+        
         glBegin(GL_QUADS)
         
         # Front face
         glNormal3f(0, 0, 1)
-        glVertex3f(-0.5, -0.5, 0.5)
-        glVertex3f(0.5, -0.5, 0.5)
-        glVertex3f(0.5, 0.5, 0.5)
-        glVertex3f(-0.5, 0.5, 0.5)
+        glVertex3f(-x, -y, z)
+        glVertex3f(x, -y, z)
+        glVertex3f(x, y, z)
+        glVertex3f(-x, y, z)
         
         # Back face
         glNormal3f(0, 0, -1)
-        glVertex3f(-0.5, -0.5, -0.5)
-        glVertex3f(-0.5, 0.5, -0.5)
-        glVertex3f(0.5, 0.5, -0.5)
-        glVertex3f(0.5, -0.5, -0.5)
+        glVertex3f(-x, -y, -z)
+        glVertex3f(-x, y, -z)
+        glVertex3f(x, y, -z)
+        glVertex3f(x, -y, -z)
         
         # Top face
         glNormal3f(0, 1, 0)
-        glVertex3f(-0.5, 0.5, -0.5)
-        glVertex3f(-0.5, 0.5, 0.5)
-        glVertex3f(0.5, 0.5, 0.5)
-        glVertex3f(0.5, 0.5, -0.5)
+        glVertex3f(-x, y, -z)
+        glVertex3f(-x, y, z)
+        glVertex3f(x, y, z)
+        glVertex3f(x, y, -z)
         
         # Bottom face
         glNormal3f(0, -1, 0)
-        glVertex3f(-0.5, -0.5, -0.5)
-        glVertex3f(0.5, -0.5, -0.5)
-        glVertex3f(0.5, -0.5, 0.5)
-        glVertex3f(-0.5, -0.5, 0.5)
+        glVertex3f(-x, -y, -z)
+        glVertex3f(x, -y, -z)
+        glVertex3f(x, -y, z)
+        glVertex3f(-x, -y, z)
         
         # Right face
         glNormal3f(1, 0, 0)
-        glVertex3f(0.5, -0.5, -0.5)
-        glVertex3f(0.5, 0.5, -0.5)
-        glVertex3f(0.5, 0.5, 0.5)
-        glVertex3f(0.5, -0.5, 0.5)
+        glVertex3f(x, -y, -z)
+        glVertex3f(x, y, -z)
+        glVertex3f(x, y, z)
+        glVertex3f(x, -y, z)
         
         # Left face
         glNormal3f(-1, 0, 0)
-        glVertex3f(-0.5, -0.5, -0.5)
-        glVertex3f(-0.5, -0.5, 0.5)
-        glVertex3f(-0.5, 0.5, 0.5)
-        glVertex3f(-0.5, 0.5, -0.5)
+        glVertex3f(-x, -y, -z)
+        glVertex3f(-x, -y, z)
+        glVertex3f(-x, y, z)
+        glVertex3f(-x, y, -z)
         
         glEnd()
         
@@ -860,146 +1074,245 @@ class Game3DScreen(BaseScreen):
         glTranslatef(self.ball_x, self.ball_y, self.ball_z)
         
         # Set ball material
-        glMaterialfv(GL_FRONT, GL_AMBIENT, [0.2, 0.2, 0.8, 1.0])
-        glMaterialfv(GL_FRONT, GL_DIFFUSE, [0.4, 0.4, 1.0, 1.0])
-        glMaterialfv(GL_FRONT, GL_SPECULAR, [0.8, 0.8, 1.0, 1.0])
-        glMaterialf(GL_FRONT, GL_SHININESS, 50.0)
+        self._apply_material(BALL_MATERIAL)
         
         # Draw sphere
-        quadric = gluNewQuadric()
-        gluSphere(quadric, self.ball_radius, 20, 20)
-        gluDeleteQuadric(quadric)
+        self._draw_sphere(self.ball_radius)
         
         glPopMatrix()
         
-    def _draw_score_card(self, window_width, window_height):
-        """Draw a score card with score, timer, and stats"""
-        # Disable depth testing and lighting for UI
-        glDisable(GL_DEPTH_TEST)
-        glDisable(GL_LIGHTING)
+    def _apply_material(self, material):
+        """Set the front material from a display list compiled on first use"""
+        material_list = self._material_lists.get(material)
+        if material_list is None:
+            ambient, diffuse, specular, shininess = material
+            material_list = glGenLists(1)
+            glNewList(material_list, GL_COMPILE)
+            glMaterialfv(GL_FRONT, GL_AMBIENT, ambient)
+            glMaterialfv(GL_FRONT, GL_DIFFUSE, diffuse)
+            glMaterialfv(GL_FRONT, GL_SPECULAR, specular)
+            glMaterialf(GL_FRONT, GL_SHININESS, shininess)
+            glEndList()
+            self._material_lists[material] = material_list
+        glCallList(material_list)
+        
+    def _draw_sphere(self, radius):
+        """Draw a ball sphere from a vertex buffer (display list without VBO support)"""
+        if self._sphere_vbo_supported:
+            sphere = self._sphere_buffers.get(radius)
+            if sphere is None:
+                sphere = self._create_sphere_buffer(radius)
+            if sphere is not None:
+                sphere_buffer, count = sphere
+                glPushClientAttrib(GL_CLIENT_VERTEX_ARRAY_BIT)
+                glBindBuffer(GL_ARRAY_BUFFER, sphere_buffer)
+                glInterleavedArrays(GL_N3F_V3F, 0, None)
+                glDrawArrays(GL_TRIANGLES, 0, count)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
+                glPopClientAttrib()
+                return
+        
+        sphere_list = self._sphere_lists.get(radius)
+        if sphere_list is None:
+            if self._ball_quadric is None:
+                self._ball_quadric = gluNewQuadric()
+            sphere_list = glGenLists(1)
+            glNewList(sphere_list, GL_COMPILE)
+            gluSphere(self._ball_quadric, radius, BALL_SLICES, BALL_STACKS)
+            glEndList()
+            self._sphere_lists[radius] = sphere_list
+        glCallList(sphere_list)
+        
+    def _create_sphere_buffer(self, radius, slices=BALL_SLICES, stacks=BALL_STACKS):
+        """Upload a lat/lon sphere as N3F_V3F triangles, returns (buffer, count) or None"""
+        # Unit normals on the lat/lon grid, the vertex is the normal times the radius
+        rings = []
+        for i in range(stacks + 1):
+            lat = math.pi * (-0.5 + i / stacks)
+            ring = []
+            for j in range(slices + 1):
+                lon = 2 * math.pi * j / slices
+                ring.append((math.cos(lat) * math.cos(lon), math.sin(lat), math.cos(lat) * math.sin(lon)))
+            rings.append(ring)
+        
+        values = []
+        for i in range(stacks):
+            for j in range(slices):
+                # Two triangles per grid cell, counter-clockwise from outside
+                a, b = rings[i][j], rings[i + 1][j]
+                c, d = rings[i][j + 1], rings[i + 1][j + 1]
+                for nx, ny, nz in (a, b, c, c, b, d):
+                    values.extend((nx, ny, nz, nx * radius, ny * radius, nz * radius))
+        
+        try:
+            sphere_buffer = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, sphere_buffer)
+            glBufferData(GL_ARRAY_BUFFER, (GLfloat * len(values))(*values), GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        except Exception as e:
+            print(f"Vertex buffers unavailable, drawing the ball from display lists: {e}")
+            self._sphere_vbo_supported = False
+            return None
+        
+        sphere = (sphere_buffer, len(values) // 6)
+        self._sphere_buffers[radius] = sphere
+        return sphere
         
+    def _draw_score_card(self, window_width, window_height):
+        """Draw a score card with score, timer, and stats (expects the 2D projection)"""
         # Score card background
         card_width = 220
         card_height = 100
         card_x = window_width - card_width - 20
         card_y = window_height - card_height - 20
         
+        background_list, border_list = self._get_card_lists(card_width, card_height)
+        glPushMatrix()
+        glTranslatef(card_x, card_y, 0.0)
+        
         # Draw semi-transparent background
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glColor4f(0.0, 0.0, 0.0, 0.8)  # Semi-transparent black
-        glBegin(GL_QUADS)
-        glVertex2f(card_x, card_y)
-        glVertex2f(card_x + card_width, card_y)
-        glVertex2f(card_x + card_width, card_y + card_height)
-        glVertex2f(card_x, card_y + card_height)
-        glEnd()
+        glCallList(background_list)
         
         # Draw border
         glDisable(GL_BLEND)
         glColor3f(1.0, 1.0, 1.0)
-        glLineWidth(2.0)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(card_x, card_y)
-        glVertex2f(card_x + card_width, card_y)
-        glVertex2f(card_x + card_width, card_y + card_height)
-        glVertex2f(card_x, card_y + card_height)
-        glEnd()
+        glCallList(border_list)
+        glPopMatrix()
         
         # Text content using simple fonts
         text_x = card_x + 10
         text_y = card_y + card_height - 20
         
+        score_text, timer_text, platform_text, stats_text = self._get_card_texts()
+        
         # Score
         glColor3f(1.0, 1.0, 0.0)  # Yellow
-        score_text = f"SCORE: {self.score}"
-        glRasterPos2f(text_x, text_y)
-        for char in score_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+        UIRenderer.draw_text(score_text, text_x, text_y, GLUT_BITMAP_HELVETICA_12)
         
         # Timer
         text_y -= 20
         glColor3f(0.0, 1.0, 1.0)  # Cyan
-        timer_text = f"TIME: {self.game_time:.1f}s"
-        glRasterPos2f(text_x, text_y)
-        for char in timer_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+        UIRenderer.draw_text(timer_text, text_x, text_y, GLUT_BITMAP_HELVETICA_12)
         
         # Platform progress
         text_y -= 20
         glColor3f(0.0, 1.0, 0.0)  # Green
-        platform_text = f"PLATFORMS: {len(self.platforms_reached)}/{len(self.platforms)}"
-        glRasterPos2f(text_x, text_y)
-        for char in platform_text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_10, ord(char))
+        UIRenderer.draw_text(platform_text, text_x, text_y, GLUT_BITMAP_HELVETICA_10)
         
         # High score and best time (if available)
-        if self.high_score > 0 or self.best_time < float('inf'):
+        if stats_text:
             text_y -= 15
             glColor3f(1.0, 0.5, 0.0)  # Orange
-            stats_text = f"HIGH: {self.high_score}"
-            if self.best_time < float('inf'):
-                stats_text += f" | BEST: {self.best_time:.1f}s"
-            glRasterPos2f(text_x, text_y)
-            for char in stats_text:
-                glutBitmapCharacter(GLUT_BITMAP_8_BY_13, ord(char))
-        
-        # Restore OpenGL state
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+            UIRenderer.draw_text(stats_text, text_x, text_y, GLUT_BITMAP_8_BY_13)
+        
+    def _get_card_texts(self):
+        """Get the score card lines, reformatted only when a shown value changes"""
+        key = (self.score, round(self.game_time, 1), self.platforms_reached_count,
+               self.high_score, self.best_time)
+        if key != self._card_text_key:
+            self._card_text_key = key
+            stats_text = ""
+            if self.high_score > 0 or self.best_time < float('inf'):
+                stats_text = f"HIGH: {self.high_score}"
+                if self.best_time < float('inf'):
+                    stats_text += f" | BEST: {self.best_time:.1f}s"
+            self._card_texts = (f"SCORE: {self.score}",
+                                f"TIME: {self.game_time:.1f}s",
+                                f"PLATFORMS: {self.platforms_reached_count}/{len(self.platforms)}",
+                                stats_text)
+        return self._card_texts
+        
+    def _get_card_lists(self, width, height):
+        """Get (compiling on first use) the card background and 2 px border lists"""
+        if self._card_lists is None:
+            background_list = glGenLists(2)
+            border_list = background_list + 1
+            glNewList(background_list, GL_COMPILE)
+            glBegin(GL_QUADS)
+            glVertex2f(0.0, 0.0)
+            glVertex2f(width, 0.0)
+            glVertex2f(width, height)
+            glVertex2f(0.0, height)
+            glEnd()
+            glEndList()
+            
+            # Border as a ring of quads one pixel either side of the edges
+            glNewList(border_list, GL_COMPILE)
+            glBegin(GL_QUADS)
+            for x0, y0, x1, y1 in ((-1.0, -1.0, width + 1.0, 1.0),
+                                   (-1.0, height - 1.0, width + 1.0, height + 1.0),
+                                   (-1.0, 1.0, 1.0, height - 1.0),
+                                   (width - 1.0, 1.0, width + 1.0, height - 1.0)):
+                glVertex2f(x0, y0)
+                glVertex2f(x1, y0)
+                glVertex2f(x1, y1)
+                glVertex2f(x0, y1)
+            glEnd()
+            glEndList()
+            self._card_lists = (background_list, border_list)
+        return self._card_lists
         
     def _render_ui(self):
         """Render UI elements"""
-        window_width = glutGet(GLUT_WINDOW_WIDTH)
-        window_height = glutGet(GLUT_WINDOW_HEIGHT)
+        window_width, window_height = self.opengl_manager.get_window_size()
         
         if self.game_over:
             # Game Over screen with eye-catching colors
             glColor3f(1.0, 0.2, 0.2)  # Bright red with slight orange tint
             game_over_text = "GAME OVER!"
-            glRasterPos2f(window_width//2 - 50, window_height//2)
-            for char in game_over_text:
-                glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(char))
+            UIRenderer.draw_text(game_over_text, window_width//2 - 50, window_height//2, GLUT_BITMAP_TIMES_ROMAN_24)
                 
             glColor3f(1.0, 1.0, 0.0)  # Bright yellow for instructions
             restart_text = "Press R to restart, ESC to quit"
-            glRasterPos2f(window_width//2 - 100, window_height//2 - 30)
-            for char in restart_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+            UIRenderer.draw_text(restart_text, window_width//2 - 100, window_height//2 - 30, GLUT_BITMAP_HELVETICA_12)
         else:
             # Draw score card
             self._draw_score_card(window_width, window_height)
             
-            # Normal game UI
+            # Normal game UI (controls hint only at the start of a run)
             glColor3f(1.0, 1.0, 1.0)
-            controls_text = "Controls: WASD to move, SPACE to jump, ESC to quit"
-            glRasterPos2f(20, window_height - 20)
-            for char in controls_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+            if self.game_time < self.controls_hint_duration:
+                controls_text = "Controls: WASD to move, SPACE to jump, ESC to quit"
+                UIRenderer.draw_text(controls_text, 20, window_height - 20, GLUT_BITMAP_HELVETICA_12)
                 
+            # Refresh the position/velocity readout at a readable rate
+            if self.last_time - self._hud_last_update >= self.hud_refresh_interval:
+                self._hud_last_update = self.last_time
+                self._hud_pos_text = f"Position: X={self.ball_x:.1f}, Y={self.ball_y:.1f}, Z={self.ball_z:.1f}"
+                speed = math.sqrt(self.ball_vel_x * self.ball_vel_x + self.ball_vel_z * self.ball_vel_z)
+                self._hud_vel_text = f"Speed: {speed:.1f} | Velocity: X={self.ball_vel_x:.1f}, Y={self.ball_vel_y:.1f}, Z={self.ball_vel_z:.1f}"
+            
             # Draw ball position and velocity
-            pos_text = f"Position: X={self.ball_x:.1f}, Y={self.ball_y:.1f}, Z={self.ball_z:.1f}"
-            glRasterPos2f(20, window_height - 40)
-            for char in pos_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(char))
+            UIRenderer.draw_text(self._hud_pos_text, 20, window_height - 40, GLUT_BITMAP_HELVETICA_12)
                 
             # Show velocity for physics feedback
-            speed = math.sqrt(self.ball_vel_x**2 + self.ball_vel_z**2)
-            vel_text = f"Speed: {speed:.1f} | Velocity: X={self.ball_vel_x:.1f}, Y={self.ball_vel_y:.1f}, Z={self.ball_vel_z:.1f}"
-            glRasterPos2f(20, window_height - 60)
-            for char in vel_text:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_10, ord(char))
+            UIRenderer.draw_text(self._hud_vel_text, 20, window_height - 60, GLUT_BITMAP_HELVETICA_10)
 
-    def _render_ui_for_player(self, player_index, vp_width, vp_height):
-        """Render per-player UI for current viewport"""
+    def _begin_ui_2d(self, window_width, window_height):
+        """Switch to a full-window 2D projection for the split-screen overlays"""
+        glViewport(0, 0, window_width, window_height)
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
-        glOrtho(0, vp_width, vp_height, 0, -1, 1)
+        glOrtho(0, window_width, window_height, 0, -1, 1)
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
         glDisable(GL_LIGHTING)
         glDisable(GL_DEPTH_TEST)
         
+    def _end_ui_2d(self):
+        """Restore the 3D state after the split-screen overlays"""
+        glEnable(GL_DEPTH_TEST)
+        glEnable(GL_LIGHTING)
+        
+    def _render_ui_for_player(self, player_index, vp_x, vp_width, vp_height):
+        """Render per-player UI for a viewport (expects the _begin_ui_2d projection)"""
+        # Viewport-local coordinates, offset to the player's half of the window
+        glPushMatrix()
+        glTranslatef(vp_x, 0.0, 0.0)
+        
         if player_index == 1:
             score = self.score
             over = self.game_over_p1
@@ -1023,121 +1336,112 @@ class Game3DScreen(BaseScreen):
                     glColor3f(1.0, 0.2, 0.4)  # Bright red-pink for loser
                     text = "YOU LOSE"
                 
-                glRasterPos2f(vp_width//2 - 50, vp_height//2 - 30)
-                for ch in text:
-                    glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(ch))
+                UIRenderer.draw_text(text, vp_width//2 - 50, vp_height//2 - 30, GLUT_BITMAP_TIMES_ROMAN_24)
                 
                 # Show winner reason with bright yellow
                 glColor3f(1.0, 1.0, 0.2)  # Bright yellow for reason text
                 reason_lines = self.winner_reason.split('!')
                 for i, line in enumerate(reason_lines):
                     if line.strip():
-                        glRasterPos2f(vp_width//2 - 80, vp_height//2 + 10 + i * 20)
-                        for ch in line.strip():
-                            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(ch))
+                        UIRenderer.draw_text(line.strip(), vp_width//2 - 80, vp_height//2 + 10 + i * 20, GLUT_BITMAP_HELVETICA_12)
             else:
                 glColor3f(1.0, 0.2, 0.2)  # Bright red with orange tint
                 text = "GAME OVER"
-                glRasterPos2f(vp_width//2 - 50, vp_height//2)
-                for ch in text:
-                    glutBitmapCharacter(GLUT_BITMAP_TIMES_ROMAN_24, ord(ch))
+                UIRenderer.draw_text(text, vp_width//2 - 50, vp_height//2, GLUT_BITMAP_TIMES_ROMAN_24)
         else:
             glColor3f(1.0, 1.0, 0.0)
             s = f"SCORE: {score}"
-            glRasterPos2f(10, 20)
-            for ch in s:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(ch))
-            glColor3f(1.0, 1.0, 1.0)
-            glRasterPos2f(10, 40)
-            for ch in controls:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(ch))
+            UIRenderer.draw_text(s, 10, 20, GLUT_BITMAP_HELVETICA_12)
+            if self.game_time < self.controls_hint_duration:
+                glColor3f(1.0, 1.0, 1.0)
+                UIRenderer.draw_text(controls, 10, 40, GLUT_BITMAP_HELVETICA_12)
             glColor3f(0.8, 0.9, 1.0)
-            pos = f"Pos X={bx:.1f} Y={by:.1f} Z={bz:.1f}"
-            glRasterPos2f(10, 60)
-            for ch in pos:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_12, ord(ch))
-            speed = math.sqrt(vx*vx + vz*vz)
-            vel = f"Speed {speed:.1f} | Vx={vx:.1f} Vy={vy:.1f} Vz={vz:.1f}"
-            glRasterPos2f(10, 80)
-            for ch in vel:
-                glutBitmapCharacter(GLUT_BITMAP_HELVETICA_10, ord(ch))
+            pos, vel = self._get_player_hud_text(player_index, bx, by, bz, vx, vy, vz)
+            UIRenderer.draw_text(pos, 10, 60, GLUT_BITMAP_HELVETICA_12)
+            UIRenderer.draw_text(vel, 10, 80, GLUT_BITMAP_HELVETICA_10)
         
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+        glPopMatrix()
+    
+    def _get_player_hud_text(self, player_index, bx, by, bz, vx, vy, vz):
+        """Get a player's position/velocity readout, reformatted only when the shown digits change"""
+        speed = math.sqrt(vx*vx + vz*vz)
+        key = (round(bx, 1), round(by, 1), round(bz, 1),
+               round(speed, 1), round(vx, 1), round(vy, 1), round(vz, 1))
+        cached = self._player_hud_text.get(player_index)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        
+        pos = f"Pos X={bx:.1f} Y={by:.1f} Z={bz:.1f}"
+        vel = f"Speed {speed:.1f} | Vx={vx:.1f} Vy={vy:.1f} Vz={vz:.1f}"
+        self._player_hud_text[player_index] = (key, pos, vel)
+        return pos, vel
     
     def _render_multiplayer_divider(self, window_width, window_height):
-        """Render a visible divider line between the two player viewports"""
-        # Set up 2D rendering for the full screen
-        glViewport(0, 0, window_width, window_height)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        glOrtho(0, window_width, window_height, 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        
-        # Disable lighting and depth testing for 2D overlay
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
+        """Render a visible divider line between the two player viewports (expects the _begin_ui_2d projection)"""
         # Enable blending for semi-transparent effects
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         
+        # Divider line, its shadows and the VS text background
+        glCallList(self._get_divider_list(window_width, window_height))
+        
+        # Add "VS" text in the middle for a game-like feel
+        text = "VS"
+        text_y = window_height // 2 - 10
+        text_x = window_width // 2 - 10  # Center the text
+        
+        glColor3f(1.0, 1.0, 1.0)  # White text
+        UIRenderer.draw_text(text, text_x, text_y, GLUT_BITMAP_HELVETICA_18)
+        
+        glDisable(GL_BLEND)
+            
+    def _get_divider_list(self, window_width, window_height):
+        """Get (compiling when the window size changes) the divider quads display list"""
+        if self._divider_list is not None and self._divider_size == (window_width, window_height):
+            return self._divider_list
+        if self._divider_list is None:
+            self._divider_list = glGenLists(1)
+        self._divider_size = (window_width, window_height)
+        
         # Calculate divider position (middle of screen)
         divider_x = window_width // 2
         divider_width = 4  # Width of the divider line
+        shadow_width = 1
+        text_y = window_height // 2 - 10
+        text_x = divider_x - 10
         
-        # Draw the main divider line (bright white/yellow)
-        glColor4f(1.0, 1.0, 0.8, 0.9)  # Light yellow with high opacity
+        glNewList(self._divider_list, GL_COMPILE)
         glBegin(GL_QUADS)
+        
+        # Main divider line (bright white/yellow)
+        glColor4f(1.0, 1.0, 0.8, 0.9)  # Light yellow with high opacity
         glVertex2f(divider_x - divider_width//2, 0)
         glVertex2f(divider_x + divider_width//2, 0)
         glVertex2f(divider_x + divider_width//2, window_height)
         glVertex2f(divider_x - divider_width//2, window_height)
-        glEnd()
         
-        # Draw subtle shadow/border on both sides for better visibility
-        shadow_width = 1
+        # Subtle shadow/border on both sides for better visibility
         glColor4f(0.0, 0.0, 0.0, 0.4)  # Dark shadow
-        
-        # Left shadow
-        glBegin(GL_QUADS)
         glVertex2f(divider_x - divider_width//2 - shadow_width, 0)
         glVertex2f(divider_x - divider_width//2, 0)
         glVertex2f(divider_x - divider_width//2, window_height)
         glVertex2f(divider_x - divider_width//2 - shadow_width, window_height)
-        glEnd()
         
-        # Right shadow
-        glBegin(GL_QUADS)
         glVertex2f(divider_x + divider_width//2, 0)
         glVertex2f(divider_x + divider_width//2 + shadow_width, 0)
         glVertex2f(divider_x + divider_width//2 + shadow_width, window_height)
         glVertex2f(divider_x + divider_width//2, window_height)
-        glEnd()
-        
-        # Add "VS" text in the middle for a game-like feel
-        text = "VS"
-        text_y = window_height // 2 - 10
-        text_x = divider_x - 10  # Center the text
         
-        glColor4f(0.0, 0.0, 0.0, 0.8)  # Dark background for text
-        glBegin(GL_QUADS)
+        # Dark background for the VS text
+        glColor4f(0.0, 0.0, 0.0, 0.8)
         glVertex2f(text_x - 15, text_y - 8)
         glVertex2f(text_x + 15, text_y - 8)
         glVertex2f(text_x + 15, text_y + 12)
         glVertex2f(text_x - 15, text_y + 12)
-        glEnd()
-        
-        glColor3f(1.0, 1.0, 1.0)  # White text
-        glRasterPos2f(text_x, text_y)
-        for char in text:
-            glutBitmapCharacter(GLUT_BITMAP_HELVETICA_18, ord(char))
         
-        # Restore OpenGL state
-        glDisable(GL_BLEND)
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+        glEnd()
+        glEndList()
+        return self._divider_list
             
     def handle_key_press(self, key):
         """Handle key press events"""
@@ -1170,27 +1474,17 @@ class Game3DScreen(BaseScreen):
         """Handle Arrow keys for P2"""
         if not self.is_multiplayer or self.game_over_p2:
             return
-        if key == GLUT_KEY_UP:
-            self.keys_pressed_p2['up'] = True
-        elif key == GLUT_KEY_DOWN:
-            self.keys_pressed_p2['down'] = True
-        elif key == GLUT_KEY_LEFT:
-            self.keys_pressed_p2['left'] = True
-        elif key == GLUT_KEY_RIGHT:
-            self.keys_pressed_p2['right'] = True
+        slot = P2_ARROW_KEYS.get(key)
+        if slot is not None:
+            self.keys_pressed_p2[slot] = True
     
     def handle_special_key_release(self, key):
         """Handle Arrow key releases for P2"""
         if not self.is_multiplayer:
             return
-        if key == GLUT_KEY_UP:
-            self.keys_pressed_p2['up'] = False
-        elif key == GLUT_KEY_DOWN:
-            self.keys_pressed_p2['down'] = False
-        elif key == GLUT_KEY_LEFT:
-            self.keys_pressed_p2['left'] = False
-        elif key == GLUT_KEY_RIGHT:
-            self.keys_pressed_p2['right'] = False
+        slot = P2_ARROW_KEYS.get(key)
+        if slot is not None:
+            self.keys_pressed_p2[slot] = False
             
     def _restart_game(self):
         """Restart the game"""
@@ -1203,6 +1497,8 @@ class Game3DScreen(BaseScreen):
         self.game_over = False
         self.game_over_p1 = False
         self.game_over_p2 = False
+        self._scene_frozen = False
+        self._hud_last_update = float('-inf')
         
         # Reset VS game state
         self.game_ended = False
@@ -1211,9 +1507,11 @@ class Game3DScreen(BaseScreen):
         
         # Reset score and timer
         self.score = 0
-        self.platforms_reached = set()
-        self.start_time = time.time()
+        self.platforms_reached_mask = 0
+        self.platforms_reached_count = 0
+        self.start_time = time.perf_counter()
         self.game_time = 0.0
+        self._step_accumulator = 0.0
         
         # Reset Player 2 state when in multiplayer
         self.ball2_x = 0.0
@@ -1223,12 +1521,13 @@ class Game3DScreen(BaseScreen):
         self.ball2_vel_y = 0.0
         self.ball2_vel_z = 0.0
         self.score_p2 = 0
-        self.platforms_reached_p2 = set()
+        self.platforms_reached_mask_p2 = 0
+        self.platforms_reached_count_p2 = 0
         
         # Clear pressed keys
-        for k in list(self.keys_pressed.keys()):
+        for k in self.keys_pressed:
             self.keys_pressed[k] = False
-        for k in list(self.keys_pressed_p2.keys()):
+        for k in self.keys_pressed_p2:
             self.keys_pressed_p2[k] = False
         print("Game restarted!")
         
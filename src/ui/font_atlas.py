@@ -0,0 +1,322 @@
+"""
+Prebaked GLUT bitmap font atlas.
+Glyphs are rendered once with glutBitmapCharacter into an offscreen framebuffer
+(the back buffer without framebuffer objects), read back into a texture
+and then drawn as textured quads, one draw call per string. Fonts that could
+not be baked fall back to per-glyph display lists called with glCallLists.
+"""
+
+import math
+from collections import OrderedDict
+from OpenGL.GL import *
+from OpenGL.GLUT import *
+
+# Printable ASCII range baked into the atlas
+FIRST_CHAR = 32
+LAST_CHAR = 126
+
+# Atlas cell layout (pixels)
+ATLAS_COLUMNS = 16
+CELL_PAD = 4  # Room for glyphs that hang left of / past their advance
+CELL_HEIGHT = 40
+CELL_BASELINE = 10  # Room for descenders below the raster origin
+
+# Cached vertex arrays and pixel widths for recently drawn strings
+MAX_CACHED_STRINGS = 256
+
+# Offsets of a single, unshifted copy
+NO_OFFSET = ((0, 0),)
+
+
+def _is_atlas_text(text):
+    """Check that every character is in the baked range (printable ASCII)"""
+    return text.isascii() and text.isprintable()
+
+
+def _font_key(font):
+    """Hashable key for a GLUT font handle"""
+    return getattr(font, 'value', font)
+
+
+def _atlas_layout(font):
+    """Get a font's glyph advances, cell width and atlas width and height"""
+    advances = [glutBitmapWidth(font, code) for code in range(FIRST_CHAR, LAST_CHAR + 1)]
+    cell_width = max(advances) + 2 * CELL_PAD
+    rows = (len(advances) + ATLAS_COLUMNS - 1) // ATLAS_COLUMNS
+    return advances, cell_width, cell_width * ATLAS_COLUMNS, CELL_HEIGHT * rows
+
+
+def _create_framebuffer(width, height):
+    """Create and bind an offscreen color target, None without framebuffer objects"""
+    if not bool(glGenFramebuffers):
+        return None
+    framebuffer = glGenFramebuffers(1)
+    renderbuffer = glGenRenderbuffers(1)
+    glBindFramebuffer(GL_FRAMEBUFFER, framebuffer)
+    glBindRenderbuffer(GL_RENDERBUFFER, renderbuffer)
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, renderbuffer)
+    target = (framebuffer, renderbuffer)
+    if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+        _delete_framebuffer(target)
+        return None
+    return target
+
+
+def _delete_framebuffer(target):
+    """Unbind and free a target made by _create_framebuffer"""
+    framebuffer, renderbuffer = target
+    glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    glBindRenderbuffer(GL_RENDERBUFFER, 0)
+    glDeleteRenderbuffers(1, [renderbuffer])
+    glDeleteFramebuffers(1, [framebuffer])
+
+
+class FontAtlas:
+    """Bakes GLUT bitmap fonts into textures and draws text from them"""
+
+    def __init__(self):
+        self._fonts = {}
+        self._glyph_lists = {}  # Font key -> display list base (list base + code)
+        self._strings = OrderedDict()
+        self._widths = OrderedDict()
+        self._bake_attempted = False
+        self._unbaked = None  # Fonts left for the next bake, None before the first
+        self._raster_color = (GLfloat * 4)()
+
+    def is_baked(self):
+        """Check whether the atlas textures are ready"""
+        return bool(self._fonts)
+
+    def bake(self):
+        """Bake the GLUT bitmap fonts not baked yet (call before the frame's glClear)"""
+        if self._bake_attempted:
+            return
+        self._bake_attempted = True
+
+        fonts = self._unbaked
+        if fonts is None:
+            fonts = [GLUT_BITMAP_8_BY_13, GLUT_BITMAP_9_BY_15,
+                     GLUT_BITMAP_TIMES_ROMAN_10, GLUT_BITMAP_TIMES_ROMAN_24,
+                     GLUT_BITMAP_HELVETICA_10, GLUT_BITMAP_HELVETICA_12,
+                     GLUT_BITMAP_HELVETICA_18]
+
+        target = None
+        glPushAttrib(GL_ALL_ATTRIB_BITS)
+        glPushClientAttrib(GL_CLIENT_PIXEL_STORE_BIT)
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        try:
+            layouts = [_atlas_layout(font) for font in fonts]
+            width = max(layout[2] for layout in layouts)
+            height = max(layout[3] for layout in layouts)
+
+            # Back buffer pixels hidden by other windows may read back undefined,
+            # only fall back to it without framebuffer objects
+            target = _create_framebuffer(width, height)
+            if target is None:
+                width = glutGet(GLUT_WINDOW_WIDTH)
+                height = glutGet(GLUT_WINDOW_HEIGHT)
+
+            glMatrixMode(GL_PROJECTION)
+            glLoadIdentity()
+            glOrtho(0, width, 0, height, -1, 1)
+            glMatrixMode(GL_MODELVIEW)
+            glLoadIdentity()
+            glViewport(0, 0, width, height)
+            glDisable(GL_LIGHTING)
+            glDisable(GL_DEPTH_TEST)
+            glDisable(GL_TEXTURE_2D)
+            glDisable(GL_BLEND)
+            glPixelStorei(GL_PACK_ALIGNMENT, 1)
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            glReadBuffer(GL_BACK if target is None else GL_COLOR_ATTACHMENT0)
+            self._unbaked = [font for font, layout in zip(fonts, layouts)
+                             if not self._bake_font(font, layout, width, height)]
+        except Exception as e:
+            print(f"Font atlas unavailable, using GLUT bitmaps: {e}")
+            self._fonts.clear()
+            self._unbaked = []
+        finally:
+            if target is not None:
+                _delete_framebuffer(target)
+            glMatrixMode(GL_PROJECTION)
+            glPopMatrix()
+            glMatrixMode(GL_MODELVIEW)
+            glPopMatrix()
+            glPopClientAttrib()
+            glPopAttrib()
+
+    def retry_unbaked(self):
+        """Bake the fonts that did not fit the window again on the next frame"""
+        if self._unbaked:
+            self._bake_attempted = False
+
+    def _bake_font(self, font, layout, target_width, target_height):
+        """Render one font's glyphs into the bound target and upload them, False if they don't fit"""
+        advances, cell_width, atlas_width, atlas_height = layout
+        if atlas_width > target_width or atlas_height > target_height:
+            return False  # Window too small, this font uses GLUT bitmaps until a reshape
+
+        # White glyphs on black, one per cell, origin at the cell baseline
+        glClearColor(0.0, 0.0, 0.0, 0.0)
+        glClear(GL_COLOR_BUFFER_BIT)
+        glColor3f(1.0, 1.0, 1.0)
+        for index, code in enumerate(range(FIRST_CHAR, LAST_CHAR + 1)):
+            column, row = index % ATLAS_COLUMNS, index // ATLAS_COLUMNS
+            glRasterPos2i(column * cell_width + CELL_PAD, row * CELL_HEIGHT + CELL_BASELINE)
+            glutBitmapCharacter(font, code)
+
+        pixels = glReadPixels(0, 0, atlas_width, atlas_height, GL_RED, GL_UNSIGNED_BYTE)
+
+        texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA, atlas_width, atlas_height, 0,
+                     GL_ALPHA, GL_UNSIGNED_BYTE, pixels)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+        # Texture coordinates of each cell (left, bottom, right, top)
+        cells = []
+        for index in range(len(advances)):
+            column, row = index % ATLAS_COLUMNS, index // ATLAS_COLUMNS
+            cells.append((column * cell_width / atlas_width,
+                          row * CELL_HEIGHT / atlas_height,
+                          (column + 1) * cell_width / atlas_width,
+                          (row + 1) * CELL_HEIGHT / atlas_height))
+
+        self._fonts[_font_key(font)] = {
+            'texture': texture,
+            'cell_width': cell_width,
+            'advances': advances,
+            'cells': cells
+        }
+        return True
+
+    def text_width(self, text, font):
+        """Get the exact pixel width of text, the sum of its glyph advances"""
+        key = (_font_key(font), text)
+        width = self._widths.get(key)
+        if width is not None:
+            self._widths.move_to_end(key)
+            return width
+
+        glyphs = self._fonts.get(key[0])
+        if glyphs is not None and _is_atlas_text(text):
+            advances = glyphs['advances']
+            width = sum(advances[ord(char) - FIRST_CHAR] for char in text)
+        else:
+            width = sum(glutBitmapWidth(font, ord(char)) for char in text)
+
+        self._widths[key] = width
+        if len(self._widths) > MAX_CACHED_STRINGS:
+            self._widths.popitem(last=False)
+        return width
+
+    def _get_glyph_lists(self, font):
+        """Get (compiling on first use) the glyph display lists of a font"""
+        key = _font_key(font)
+        base = self._glyph_lists.get(key)
+        if base is None:
+            base = glGenLists(LAST_CHAR + 1)
+            for code in range(FIRST_CHAR, LAST_CHAR + 1):
+                glNewList(base + code, GL_COMPILE)
+                glutBitmapCharacter(font, code)
+                glEndList()
+            self._glyph_lists[key] = base
+        return base
+
+    def _draw_glyph_lists(self, text, font):
+        """Draw text at the current raster position from glyph display lists"""
+        if not _is_atlas_text(text):
+            for char in text:
+                glutBitmapCharacter(font, ord(char))
+            return
+
+        glListBase(self._get_glyph_lists(font))
+        glCallLists(text.encode('ascii'))
+        glListBase(0)
+
+    def _get_vertices(self, key, glyphs, text):
+        """Get (building if needed) the T2F_V3F quad array for a string"""
+        cache_key = (key, text)
+        cached = self._strings.get(cache_key)
+        if cached is not None:
+            self._strings.move_to_end(cache_key)
+            return cached
+
+        # Quads relative to the raster origin, y pointing down like the UI projection
+        cell_width = glyphs['cell_width']
+        advances = glyphs['advances']
+        cells = glyphs['cells']
+        top = CELL_BASELINE - CELL_HEIGHT
+        values = []
+        pen = 0
+        for char in text:
+            index = ord(char) - FIRST_CHAR
+            u0, v0, u1, v1 = cells[index]
+            left = pen - CELL_PAD
+            right = left + cell_width
+            values.extend((u0, v0, left, CELL_BASELINE, 0.0,
+                           u1, v0, right, CELL_BASELINE, 0.0,
+                           u1, v1, right, top, 0.0,
+                           u0, v1, left, top, 0.0))
+            pen += advances[index]
+
+        cached = ((GLfloat * len(values))(*values), 4 * len(text))
+        self._strings[cache_key] = cached
+        if len(self._strings) > MAX_CACHED_STRINGS:
+            self._strings.popitem(last=False)
+        return cached
+
+    def draw_text(self, text, x, y, font):
+        """Draw text with its raster origin at (x, y) in the 2D UI projection"""
+        self.draw_text_copies(text, x, y, font, NO_OFFSET)
+
+    def draw_text_copies(self, text, x, y, font, offsets):
+        """Draw text at (x, y) shifted by each (dx, dy) in offsets, binding the atlas once"""
+        glyphs = self._fonts.get(_font_key(font))
+        if glyphs is None or not _is_atlas_text(text):
+            for dx, dy in offsets:
+                glRasterPos2f(x + dx, y + dy)
+                if text:
+                    self._draw_glyph_lists(text, font)
+            return
+
+        glRasterPos2f(x, y)
+        if not text:
+            return
+        vertices, count = self._get_vertices(_font_key(font), glyphs, text)
+
+        # Bitmaps take the raster color (lit if lighting was on at glRasterPos)
+        glGetFloatv(GL_CURRENT_RASTER_COLOR, self._raster_color)
+
+        glPushAttrib(GL_ENABLE_BIT | GL_TEXTURE_BIT | GL_COLOR_BUFFER_BIT | GL_CURRENT_BIT)
+        glPushClientAttrib(GL_CLIENT_VERTEX_ARRAY_BIT)
+        glDisable(GL_LIGHTING)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, glyphs['texture'])
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glEnable(GL_ALPHA_TEST)
+        glAlphaFunc(GL_GREATER, 0.0)
+        glColor4fv(self._raster_color)
+        glInterleavedArrays(GL_T2F_V3F, 0, vertices)
+
+        # Snap each copy to the pixel glBitmap would start at
+        for dx, dy in offsets:
+            glPushMatrix()
+            glTranslatef(math.floor(x + dx + 0.0001), math.ceil(y + dy - 0.0001), 0.0)
+            glDrawArrays(GL_QUADS, 0, count)
+            glPopMatrix()
+
+        glPopClientAttrib()
+        glPopAttrib()
+
+
+# Global font atlas instance
+font_atlas = FontAtlas()
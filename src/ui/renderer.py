@@ -4,175 +4,243 @@ UI rendering utilities and helper functions.
 
 import math
 import time
+from contextlib import contextmanager
 from OpenGL.GL import *
 from OpenGL.GLUT import *
+from ui.font_atlas import font_atlas
+
+# Fonts used by the text helpers, resolved once so a missing one fails at import
+from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_12, GLUT_BITMAP_TIMES_ROMAN_24, GLUT_BITMAP_HELVETICA_18
+
+# Menu background particles, each a fan around its center over an 8 point unit circle
+PARTICLE_COUNT = 20
+PARTICLE_CIRCLE = [(math.cos(j * 2 * math.pi / 8), math.sin(j * 2 * math.pi / 8)) for j in range(8)]
+PARTICLE_VERTICES = 1 + len(PARTICLE_CIRCLE)
+# Per particle constants: index, time phase, column (percent of the spread) and height offset
+PARTICLE_SEEDS = [(i, i * 0.3, (i * 37) % 100, i * 50) for i in range(PARTICLE_COUNT)]
+_particle_firsts = (GLint * PARTICLE_COUNT)(*range(0, PARTICLE_COUNT * PARTICLE_VERTICES, PARTICLE_VERTICES))
+_particle_counts = (GLsizei * PARTICLE_COUNT)(*[PARTICLE_VERTICES] * PARTICLE_COUNT)
+
+# Loading animation ring display lists (outer, middle, inner), compiled on first use
+_loading_lists = None
+
+
+def _get_loading_lists():
+    """Get the loading ring fans at unit radius, the animation rotates and scales them"""
+    global _loading_lists
+    if _loading_lists is None:
+        base = glGenLists(3)
+        num_segments = 16
+        
+        # Outer ring, light blue fading around the circle
+        glNewList(base, GL_COMPILE)
+        glColor3f(0.2, 0.8, 1.0)
+        glBegin(GL_TRIANGLE_FAN)
+        glVertex2f(0.0, 0.0)
+        for i in range(num_segments + 1):
+            angle_rad = i * 2 * math.pi / num_segments
+            alpha = 0.3 + 0.7 * (1.0 - (i / num_segments))
+            glColor3f(0.2 * alpha, 0.8 * alpha, 1.0 * alpha)
+            glVertex2f(math.cos(angle_rad), math.sin(angle_rad))
+        glEnd()
+        glEndList()
+        
+        # Middle ring, orange
+        glNewList(base + 1, GL_COMPILE)
+        glColor3f(1.0, 0.6, 0.2)
+        glBegin(GL_TRIANGLE_FAN)
+        glVertex2f(0.0, 0.0)
+        for i in range(num_segments + 1):
+            angle_rad = i * 2 * math.pi / num_segments
+            alpha = 0.4 + 0.6 * (1.0 - (i / num_segments))
+            glColor3f(1.0 * alpha, 0.6 * alpha, 0.2 * alpha)
+            glVertex2f(math.cos(angle_rad), math.sin(angle_rad))
+        glEnd()
+        glEndList()
+        
+        # Inner core, bright yellow
+        glNewList(base + 2, GL_COMPILE)
+        glColor3f(1.0, 1.0, 0.3)
+        glBegin(GL_TRIANGLE_FAN)
+        glVertex2f(0.0, 0.0)
+        for i in range(12):
+            angle_rad = i * 2 * math.pi / 12
+            glVertex2f(math.cos(angle_rad), math.sin(angle_rad))
+        glEnd()
+        glEndList()
+        
+        _loading_lists = (base, base + 1, base + 2)
+    return _loading_lists
+
+
+# Unit quad with texture coordinates, scaled up to cover the window
+_unit_quad_list = None
+
+
+def _get_unit_quad_list():
+    """Get (compiling on first use) the unit quad display list"""
+    global _unit_quad_list
+    if _unit_quad_list is None:
+        _unit_quad_list = glGenLists(1)
+        glNewList(_unit_quad_list, GL_COMPILE)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0.0, 0.0); glVertex2f(0.0, 0.0)
+        glTexCoord2f(1.0, 0.0); glVertex2f(1.0, 0.0)
+        glTexCoord2f(1.0, 1.0); glVertex2f(1.0, 1.0)
+        glTexCoord2f(0.0, 1.0); glVertex2f(0.0, 1.0)
+        glEnd()
+        glEndList()
+    return _unit_quad_list
 
-# Import specific font constants to avoid issues
-try:
-    from OpenGL.GLUT import GLUT_BITMAP_HELVETICA_12, GLUT_BITMAP_TIMES_ROMAN_24, GLUT_BITMAP_HELVETICA_18
-except ImportError:
-    # Fallback if specific imports don't work
-    pass
 
 class UIRenderer:
     """Utility class for rendering UI elements"""
     
     @staticmethod
-    def get_text_width(text, font):
-        """Calculate approximate text width for centering"""
+    @contextmanager
+    def alpha_blending():
+        """Blend with the standard alpha function for the duration of the block"""
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         try:
-            if font is None:
-                font = GLUT_BITMAP_HELVETICA_12
-            if font == GLUT_BITMAP_TIMES_ROMAN_24:
-                return len(text) * 15  # Approximate character width for large font
-            elif font == GLUT_BITMAP_HELVETICA_18:
-                return len(text) * 11  # Approximate character width for medium font
-            else:
-                return len(text) * 8   # Approximate character width for small font
-        except:
-            # Fallback width calculation
-            return len(text) * 8
+            yield
+        finally:
+            glDisable(GL_BLEND)
     
     @staticmethod
-    def draw_centered_text(text, y, font, color=(1.0, 1.0, 1.0)):
+    def get_text_width(text, font):
+        """Calculate the exact pixel width of text for centering"""
+        if font is None:
+            font = GLUT_BITMAP_HELVETICA_12
+        return font_atlas.text_width(text, font)
+    
+    @staticmethod
+    def draw_centered_text(text, y, font, color=(1.0, 1.0, 1.0), window_width=None):
         """Draw text centered horizontally"""
-        try:
-            if font is None:
-                font = GLUT_BITMAP_HELVETICA_12
+        if font is None:
+            font = GLUT_BITMAP_HELVETICA_12
+        if window_width is None:
             window_width = glutGet(GLUT_WINDOW_WIDTH)
-            text_width = UIRenderer.get_text_width(text, font)
-            x = (window_width - text_width) // 2
-            
-            glColor3f(*color)
-            glRasterPos2f(x, y)
-            for char in text:
-                glutBitmapCharacter(font, ord(char))
-        except:
-            # Fallback if fonts not available
-            pass
+        text_width = UIRenderer.get_text_width(text, font)
+        x = (window_width - text_width) // 2
+        
+        glColor3f(*color)
+        font_atlas.draw_text(text, x, y, font)
     
     @staticmethod
     def draw_text(text, x, y, font=None):
-        """Draw text at specified position"""
-        try:
-            if font is None:
-                font = GLUT_BITMAP_HELVETICA_12
-            glRasterPos2f(x, y)
-            for char in text:
-                glutBitmapCharacter(font, ord(char))
-        except:
-            # Fallback if fonts not available
-            pass
+        """Draw text at specified position from the font atlas (GLUT bitmaps until it is baked)"""
+        if font is None:
+            font = GLUT_BITMAP_HELVETICA_12
+        font_atlas.draw_text(text, x, y, font)
+    
+    @staticmethod
+    def draw_text_copies(text, x, y, font, offsets):
+        """Draw text from the font atlas once per (dx, dy) offset, sharing the texture setup"""
+        font_atlas.draw_text_copies(text, x, y, font, offsets)
     
     @staticmethod
     def draw_loading_animation(center_x, center_y, radius=30):
         """Draw rotating loading animation"""
         from screens.loading_screen import LoadingScreen
         angle = LoadingScreen.get_animation_angle()
+        outer_list, middle_list, inner_list = _get_loading_lists()
         
-        # Draw spinning outer ring
-        glColor3f(0.2, 0.8, 1.0)  # Light blue
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex2f(center_x, center_y)
+        glPushMatrix()
+        glTranslatef(center_x, center_y, 0.0)
         
-        num_segments = 16
-        for i in range(num_segments + 1):
-            angle_rad = (i * 2 * math.pi / num_segments) + math.radians(angle)
-            x = center_x + radius * math.cos(angle_rad)
-            y = center_y + radius * math.sin(angle_rad)
-            # Fade effect based on position
-            alpha = 0.3 + 0.7 * (1.0 - (i / num_segments))
-            glColor3f(0.2 * alpha, 0.8 * alpha, 1.0 * alpha)
-            glVertex2f(x, y)
-        glEnd()
+        # Draw spinning outer ring
+        glPushMatrix()
+        glRotatef(angle, 0.0, 0.0, 1.0)
+        glScalef(radius, radius, 1.0)
+        glCallList(outer_list)
+        glPopMatrix()
         
-        # Draw middle ring
-        glColor3f(1.0, 0.6, 0.2)  # Orange
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex2f(center_x, center_y)
-        
-        mid_radius = radius * 0.7
-        for i in range(num_segments + 1):
-            angle_rad = (i * 2 * math.pi / num_segments) - math.radians(angle * 1.5)
-            x = center_x + mid_radius * math.cos(angle_rad)
-            y = center_y + mid_radius * math.sin(angle_rad)
-            alpha = 0.4 + 0.6 * (1.0 - (i / num_segments))
-            glColor3f(1.0 * alpha, 0.6 * alpha, 0.2 * alpha)
-            glVertex2f(x, y)
-        glEnd()
+        # Draw middle ring, spinning the other way
+        glPushMatrix()
+        glRotatef(-angle * 1.5, 0.0, 0.0, 1.0)
+        glScalef(radius * 0.7, radius * 0.7, 1.0)
+        glCallList(middle_list)
+        glPopMatrix()
         
         # Draw inner core
-        glColor3f(1.0, 1.0, 0.3)  # Bright yellow
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex2f(center_x, center_y)
-        
-        inner_radius = radius * 0.3
-        for i in range(12):
-            angle_rad = (i * 2 * math.pi / 12) + math.radians(angle * 2)
-            x = center_x + inner_radius * math.cos(angle_rad)
-            y = center_y + inner_radius * math.sin(angle_rad)
-            glVertex2f(x, y)
-        glEnd()
+        glRotatef(angle * 2, 0.0, 0.0, 1.0)
+        glScalef(radius * 0.3, radius * 0.3, 1.0)
+        glCallList(inner_list)
+        glPopMatrix()
     
     @staticmethod
-    def draw_menu_background():
-        """Draw animated background for menus"""
-        window_width = glutGet(GLUT_WINDOW_WIDTH)
-        window_height = glutGet(GLUT_WINDOW_HEIGHT)
-        
+    def draw_fullscreen_quad(window_width, window_height):
+        """Draw a window sized quad in the current color (expects the 2D projection)"""
+        glPushMatrix()
+        glScalef(window_width, window_height, 1.0)
+        glCallList(_get_unit_quad_list())
+        glPopMatrix()
+    
+    @staticmethod
+    def draw_menu_background(window_width, window_height):
+        """Draw animated background for menus (expects UIRenderer.alpha_blending to be active)"""
         # Animated gradient background
         time_factor = time.time() * 0.5
         
+        sin_t = math.sin(time_factor)
+        cos_t = math.cos(time_factor)
+        
         # Create flowing gradient
         glBegin(GL_QUADS)
         # Top gradient
-        r1, g1, b1 = 0.05 + 0.02 * math.sin(time_factor), 0.1 + 0.03 * math.cos(time_factor), 0.2 + 0.05 * math.sin(time_factor * 0.7)
+        r1, g1, b1 = 0.05 + 0.02 * sin_t, 0.1 + 0.03 * cos_t, 0.2 + 0.05 * math.sin(time_factor * 0.7)
         glColor3f(r1, g1, b1)
         glVertex2f(0, 0)
         glVertex2f(window_width, 0)
         
         # Bottom gradient
-        r2, g2, b2 = 0.1 + 0.03 * math.cos(time_factor * 0.8), 0.05 + 0.02 * math.sin(time_factor * 1.2), 0.15 + 0.04 * math.cos(time_factor)
+        r2, g2, b2 = 0.1 + 0.03 * math.cos(time_factor * 0.8), 0.05 + 0.02 * math.sin(time_factor * 1.2), 0.15 + 0.04 * cos_t
         glColor3f(r2, g2, b2)
         glVertex2f(window_width, window_height)
         glVertex2f(0, window_height)
         glEnd()
         
         # Add floating particles effect
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        
-        for i in range(20):
-            particle_time = time_factor + i * 0.3
-            x = (window_width * 0.1) + (window_width * 0.8) * ((i * 37) % 100) / 100.0
-            y = (window_height * ((particle_time * 30 + i * 50) % 360) / 360.0) % window_height
+        # All particles go out in one multi-draw from client arrays
+        vertices = []
+        colors = []
+        margin = window_width * 0.1
+        spread = window_width * 0.8
+        for i, phase, column, height_offset in PARTICLE_SEEDS:
+            particle_time = time_factor + phase
+            x = margin + spread * column / 100.0
+            y = (window_height * ((particle_time * 30 + height_offset) % 360) / 360.0) % window_height
             size = 2 + 3 * math.sin(particle_time + i)
             alpha = 0.3 + 0.2 * math.sin(particle_time * 2 + i)
             
-            glColor4f(0.6, 0.8, 1.0, alpha)
-            glBegin(GL_TRIANGLE_FAN)
-            glVertex2f(x, y)
-            for j in range(8):
-                angle = j * 2 * math.pi / 8
-                glVertex2f(x + size * math.cos(angle), y + size * math.sin(angle))
-            glEnd()
+            colors.extend((0.6, 0.8, 1.0, alpha) * PARTICLE_VERTICES)
+            vertices.extend((x, y))
+            for cos_a, sin_a in PARTICLE_CIRCLE:
+                vertices.extend((x + size * cos_a, y + size * sin_a))
+        
+        glPushClientAttrib(GL_CLIENT_VERTEX_ARRAY_BIT)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, (GLfloat * len(vertices))(*vertices))
+        glColorPointer(4, GL_FLOAT, 0, (GLfloat * len(colors))(*colors))
+        glMultiDrawArrays(GL_TRIANGLE_FAN, _particle_firsts, _particle_counts, PARTICLE_COUNT)
+        glPopClientAttrib()
         
-        glDisable(GL_BLEND)
+        # Leave the last particle color current, as the fans did
+        glColor4f(0.6, 0.8, 1.0, alpha)
     
     @staticmethod
     def draw_menu_item(text, x, y, selected=False, scale=1.0):
-        """Draw a menu item with selection highlighting"""
+        """Draw a menu item with selection highlighting (expects UIRenderer.alpha_blending to be active)"""
         font = GLUT_BITMAP_HELVETICA_18
         
-        # Calculate text dimensions
-        text_width = UIRenderer.get_text_width(text, font) * scale
-        text_height = 18 * scale
-        
         if selected:
-            # Draw selection background with glow
-            glEnable(GL_BLEND)
-            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            # Text dimensions are only needed for the highlight
+            text_width = UIRenderer.get_text_width(text, font) * scale
+            text_height = 18 * scale
             
+            # Draw selection background with glow
             # Outer glow
             padding = 15
             glColor4f(0.2, 0.6, 1.0, 0.3)
@@ -181,19 +249,15 @@ class UIRenderer:
             glVertex2f(x + text_width + padding + 5, y - text_height - 5)
             glVertex2f(x + text_width + padding + 5, y + 10)
             glVertex2f(x - padding - 5, y + 10)
-            glEnd()
             
             # Inner background
             glColor4f(0.1, 0.4, 0.8, 0.6)
-            glBegin(GL_QUADS)
             glVertex2f(x - padding, y - text_height)
             glVertex2f(x + text_width + padding, y - text_height)
             glVertex2f(x + text_width + padding, y + 5)
             glVertex2f(x - padding, y + 5)
             glEnd()
             
-            glDisable(GL_BLEND)
-            
             # Selected text color (bright white/yellow)
             glColor3f(1.0, 1.0, 0.8)
         else:
@@ -201,6 +265,4 @@ class UIRenderer:
             glColor3f(0.8, 0.9, 1.0)
         
         # Draw text
-        glRasterPos2f(x, y)
-        for char in text:
-            glutBitmapCharacter(font, ord(char))
+        font_atlas.draw_text(text, x, y, font)